@@ -0,0 +1,36 @@
+"""Add composite indexes for invoice listing and stats queries
+
+Revision ID: a1c3e5f7b901
+Revises:
+Create Date: 2026-10-15 23:00:00
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = "a1c3e5f7b901"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Tables may already have these indexes when created via init_db()
+    op.create_index(
+        "ix_invoices_user_status_created",
+        "invoices",
+        ["user_id", "status", "created_at"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "ix_invoices_user_created",
+        "invoices",
+        ["user_id", "created_at"],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_invoices_user_created", table_name="invoices", if_exists=True)
+    op.drop_index("ix_invoices_user_status_created", table_name="invoices", if_exists=True)
@@ -0,0 +1,46 @@
+"""Compute created_at/updated_at on the database side
+
+Revision ID: b2d4f6a8c013
+Revises: a1c3e5f7b901
+Create Date: 2026-10-15 23:10:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b2d4f6a8c013"
+down_revision = "a1c3e5f7b901"
+branch_labels = None
+depends_on = None
+
+TABLES = ("users", "invoices")
+COLUMNS = ("created_at", "updated_at")
+
+
+def upgrade() -> None:
+    # Existing values were written with datetime.utcnow(), so read them as UTC
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            for column in COLUMNS:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(),
+                    type_=sa.DateTime(timezone=True),
+                    server_default=sa.func.now(),
+                    postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            for column in COLUMNS:
+                batch_op.alter_column(
+                    column,
+                    existing_type=sa.DateTime(timezone=True),
+                    type_=sa.DateTime(),
+                    server_default=None,
+                    postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+                )
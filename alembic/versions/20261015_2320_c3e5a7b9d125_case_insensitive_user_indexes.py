@@ -0,0 +1,35 @@
+"""Replace users email/username indexes with unique LOWER() indexes
+
+Revision ID: c3e5a7b9d125
+Revises: b2d4f6a8c013
+Create Date: 2026-10-15 23:20:00
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c3e5a7b9d125"
+down_revision = "b2d4f6a8c013"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Fails if existing rows differ only by case - resolve those first
+    op.create_index(
+        "ix_users_email_lower", "users", [sa.text("lower(email)")], unique=True
+    )
+    op.create_index(
+        "ix_users_username_lower", "users", [sa.text("lower(username)")], unique=True
+    )
+    op.drop_index("ix_users_email", table_name="users", if_exists=True)
+    op.drop_index("ix_users_username", table_name="users", if_exists=True)
+
+
+def downgrade() -> None:
+    op.create_index("ix_users_username", "users", ["username"], unique=True)
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.drop_index("ix_users_username_lower", table_name="users")
+    op.drop_index("ix_users_email_lower", table_name="users")
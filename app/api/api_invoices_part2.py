@@ -140,7 +140,7 @@ async def send_invoice_by_email(
     **Rate Limit:** 5 emails per hour per user
     """
     # Check rate limit
-    if not validate_email_rate_limit(current_user.id, db):
+    if not validate_email_rate_limit(current_user.id, db)["allowed"]:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Email rate limit exceeded. Maximum 5 emails per hour."
@@ -182,11 +182,12 @@ async def send_invoice_by_email(
     
     # Update invoice status
     invoice.is_sent_email = True
-    invoice.email_sent_at = datetime.now()
+    invoice.email_sent_at = datetime.utcnow()
     if invoice.status == "draft":
         invoice.status = "sent"
     
     db.commit()
+    record_email_sent(current_user.id)
     
     return {
         "message": "Email is being sent",
@@ -3,9 +3,10 @@ Authentication API Endpoints
 Handles user registration, login, and token management
 """
 
+import asyncio
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import func
 from sqlalchemy.orm import Session
-from datetime import timedelta
 from ..database import get_db
 from ..models.user import User
 from ..schemas.auth import UserRegister, UserLogin, Token, UserResponse
@@ -34,24 +35,25 @@ async def register(user_data: UserRegister, db: Session = Depends(get_db)):
     - **address**: Optional address
     """
     # Check if email exists
-    if db.query(User).filter(User.email == user_data.email).first():
+    if db.query(User).filter(func.lower(User.email) == user_data.email.lower()).first():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
     # Check if username exists
-    if db.query(User).filter(User.username == user_data.username).first():
+    if db.query(User).filter(func.lower(User.username) == user_data.username.lower()).first():
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
         )
     
-    # Create new user
+    # Create new user (bcrypt runs in a worker thread to keep the loop free)
+    hashed_password = await asyncio.to_thread(hash_password, user_data.password)
     new_user = User(
         email=user_data.email,
         username=user_data.username,
-        hashed_password=hash_password(user_data.password),
+        hashed_password=hashed_password,
         full_name=user_data.full_name,
         company_name=user_data.company_name,
         phone=user_data.phone,
@@ -82,9 +84,13 @@ async def login(credentials: UserLogin, db: Session = Depends(get_db)):
     Returns JWT access token valid for 30 minutes
     """
     # Find user
-    user = db.query(User).filter(User.username == credentials.username).first()
+    user = db.query(User).filter(
+        func.lower(User.username) == credentials.username.lower()
+    ).first()
     
-    if not user or not verify_password(credentials.password, user.hashed_password):
+    if not user or not await asyncio.to_thread(
+        verify_password, credentials.password, user.hashed_password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -99,10 +105,9 @@ async def login(credentials: UserLogin, db: Session = Depends(get_db)):
         )
     
     # Create access token
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
         data={"sub": user.username, "user_id": user.id},
-        expires_delta=access_token_expires
+        expires_delta_seconds=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
     )
     
     return {
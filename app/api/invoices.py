@@ -4,7 +4,7 @@ Handles invoice creation, retrieval, PDF generation, and email sending
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -14,12 +14,18 @@ from ..models.invoice import Invoice
 from ..schemas.invoice import (
     InvoiceCreate,
     InvoiceResponse,
+    InvoiceListRow,
     InvoiceListResponse,
     InvoiceUpdate,
     EmailInvoice
 )
 from ..utils.dependencies import get_current_user
-from ..utils.helpers import generate_invoice_number, validate_email_rate_limit
+from ..utils.helpers import (
+    calculate_invoice_totals,
+    generate_invoice_number,
+    record_email_sent,
+    validate_email_rate_limit,
+)
 from ..services.pdf_service import pdf_generator
 from ..services.qr_service import generate_invoice_qr
 from ..services.email_service import send_invoice_email
@@ -61,23 +67,11 @@ async def create_invoice(
     # Generate unique invoice number
     invoice_number = generate_invoice_number()
     
-    # Prepare items for database (convert Pydantic to dict)
-    items_list = []
-    for item in invoice_data.items:
-        items_list.append({
-            "name": item.name,
-            "description": item.description,
-            "quantity": item.quantity,
-            "price": item.price,
-            "total": item.total
-        })
-    
-    # Calculate totals
-    subtotal = sum(item["total"] for item in items_list)
-    discount_amount = round(subtotal * (invoice_data.discount_rate / 100), 2)
-    subtotal_after_discount = subtotal - discount_amount
-    tax_amount = round(subtotal_after_discount * (invoice_data.tax_rate / 100), 2)
-    total = round(subtotal_after_discount + tax_amount, 2)
+    # Prepare items for database (convert Pydantic to dict, "total" is a computed field)
+    items_list = [item.model_dump() for item in invoice_data.items]
+    
+    # Calculate totals (the PDF recomputes them with the same helper)
+    totals = calculate_invoice_totals(items_list, invoice_data.tax_rate, invoice_data.discount_rate)
     
     # Generate payment link (user's unique link + invoice reference)
     payment_link = f"{current_user.payment_link}?invoice={invoice_number}"
@@ -86,12 +80,12 @@ async def create_invoice(
     qr_code_path = generate_invoice_qr(
         invoice_number=invoice_number,
         payment_link=payment_link,
-        total=total,
+        total=totals["total"],
         currency=invoice_data.currency
     )
     
-    # Generate PDF
-    pdf_path = pdf_generator.generate_invoice_pdf(
+    # Generate PDF (rendering is CPU-heavy, so it runs off the event loop)
+    pdf_path = await pdf_generator.generate_invoice_pdf_async(
         invoice_number=invoice_number,
         language=invoice_data.language,
         # Seller info (from current user)
@@ -111,7 +105,7 @@ async def create_invoice(
         tax_rate=invoice_data.tax_rate,
         discount_rate=invoice_data.discount_rate,
         # Dates
-        issue_date=datetime.now(),
+        issue_date=invoice_data.issue_date,
         due_date=invoice_data.due_date,
         # Additional
         notes=invoice_data.notes,
@@ -134,14 +128,14 @@ async def create_invoice(
         # Items
         items=items_list,
         # Financial
-        subtotal=subtotal,
+        subtotal=totals["subtotal"],
         tax_rate=invoice_data.tax_rate,
-        tax_amount=tax_amount,
+        tax_amount=totals["tax_amount"],
         discount_rate=invoice_data.discount_rate,
-        discount_amount=discount_amount,
-        total=total,
+        discount_amount=totals["discount_amount"],
+        total=totals["total"],
         # Dates
-        issue_date=datetime.now(),
+        issue_date=invoice_data.issue_date,
         due_date=invoice_data.due_date,
         # Files
         pdf_path=pdf_path,
@@ -184,7 +178,23 @@ async def get_invoice(
             detail="Invoice not found"
         )
     
-    return invoice
+    # Stored rows are trusted - build without validation and serialize directly
+    response = InvoiceResponse.from_orm_trusted(invoice)
+    return Response(content=response.model_dump_json(), media_type="application/json")
+
+
+# Columns selected for list rows (see InvoiceListRow)
+LIST_ROW_COLUMNS = (
+    Invoice.id,
+    Invoice.invoice_number,
+    Invoice.client_name,
+    Invoice.client_email,
+    Invoice.total,
+    Invoice.currency,
+    Invoice.status,
+    Invoice.issue_date,
+    Invoice.due_date,
+)
 
 
 @router.get("/", response_model=InvoiceListResponse)
@@ -204,10 +214,11 @@ async def list_invoices(
     - **status**: Filter by status - draft, sent, paid, cancelled (optional)
     
     **Returns:**
-    - List of invoices
+    - List of invoice summaries (see InvoiceListRow)
     - Total count
     - Current page
     - Page size
+    - Total pages
     """
     # Validate pagination
     if page < 1:
@@ -225,17 +236,20 @@ async def list_invoices(
     # Get total count
     total = query.count()
     
-    # Get paginated results
-    invoices = query.order_by(Invoice.created_at.desc()).offset(
-        (page - 1) * page_size
-    ).limit(page_size).all()
+    # Get paginated results - only the columns a list row needs
+    rows = query.with_entities(*LIST_ROW_COLUMNS).order_by(
+        Invoice.created_at.desc()
+    ).offset((page - 1) * page_size).limit(page_size).all()
     
-    return {
-        "invoices": invoices,
-        "total": total,
-        "page": page,
-        "page_size": page_size
-    }
+    payload = InvoiceListResponse(
+        invoices=[InvoiceListRow.from_orm_trusted(row) for row in rows],
+        total=total,
+        page=page,
+        page_size=page_size
+    )
+    
+    # Already validated - serialize straight to JSON bytes and skip re-encoding
+    return Response(content=payload.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{invoice_id}/download")
@@ -295,7 +309,7 @@ async def send_invoice_by_email(
     **Rate Limit:** 5 emails per hour per user
     """
     # Check rate limit
-    if not validate_email_rate_limit(current_user.id, db):
+    if not validate_email_rate_limit(current_user.id, db)["allowed"]:
         raise HTTPException(
             status_code=status.HTTP_429_TOO_MANY_REQUESTS,
             detail="Email rate limit exceeded. Maximum 5 emails per hour."
@@ -337,11 +351,12 @@ async def send_invoice_by_email(
     
     # Update invoice status
     invoice.is_sent_email = True
-    invoice.email_sent_at = datetime.now()
+    invoice.email_sent_at = datetime.utcnow()
     if invoice.status == "draft":
         invoice.status = "sent"
     
     db.commit()
+    record_email_sent(current_user.id)
     
     return {
         "message": "Email is being sent",
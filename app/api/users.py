@@ -3,6 +3,8 @@ User Management API Endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import Response
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from pydantic import BaseModel, EmailStr
 from typing import Optional
@@ -31,7 +33,9 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
     
     Returns complete user information including payment link
     """
-    return current_user
+    # Loaded from the database - build without validation and serialize directly
+    response = UserResponse.from_orm_trusted(current_user)
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.put("/me", response_model=UserResponse)
@@ -52,7 +56,10 @@ async def update_user_profile(
     """
     # Check if email is being changed and if it's already taken
     if update_data.email and update_data.email != current_user.email:
-        existing_user = db.query(User).filter(User.email == update_data.email).first()
+        existing_user = db.query(User).filter(
+            func.lower(User.email) == update_data.email.lower(),
+            User.id != current_user.id
+        ).first()
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -87,7 +94,6 @@ async def get_user_stats(
     Returns summary of invoices and totals
     """
     from ..models.invoice import Invoice
-    from sqlalchemy import func
     
     # Total invoices
     total_invoices = db.query(Invoice).filter(
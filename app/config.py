@@ -14,6 +14,8 @@ class Settings(BaseSettings):
     APP_NAME: str = "Invoice Generator API"
     APP_VERSION: str = "1.0.0"
     DEBUG: bool = os.getenv("DEBUG", "False").lower() == "true"
+    # Set to "false" to drop schema examples from the OpenAPI docs (smaller schema)
+    OPENAPI_EXAMPLES: bool = os.getenv("OPENAPI_EXAMPLES", "True").lower() == "true"
 
     # Base URL - Auto-detect from environment
     BASE_URL: str = os.getenv(
@@ -37,6 +39,9 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(
         os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
+    # Password hashing (bcrypt cost factor; lower it, e.g. to 4, for tests/dev)
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
     # Email Settings (SMTP)
     SMTP_HOST: str = os.getenv("SMTP_HOST", "smtp.gmail.com")
     SMTP_PORT: int = int(os.getenv("SMTP_PORT", "587"))
@@ -3,17 +3,25 @@ Database Configuration
 SQLAlchemy setup and session management
 """
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, inspect
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from typing import Generator
 from .config import settings
 
+# In-memory SQLite (used by the test suite) lives per connection, so all
+# sessions must share a single connection to see the same database
+engine_options = {}
+if "sqlite" in settings.DATABASE_URL and ":memory:" in settings.DATABASE_URL:
+    engine_options["poolclass"] = StaticPool
+
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
     connect_args={"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {},
-    echo=settings.DEBUG  # Log SQL queries in debug mode
+    echo=settings.DEBUG,  # Log SQL queries in debug mode
+    **engine_options
 )
 
 # Create session factory
@@ -40,4 +48,16 @@ def init_db():
     Initialize database (create all tables)
     Call this on application startup
     """
-    Base.metadata.create_all(bind=engine)
\ No newline at end of file
+    Base.metadata.create_all(bind=engine)
+
+def schema_matches(bind=engine) -> bool:
+    """
+    Check that every model table exists with exactly the model's columns
+    """
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    return all(
+        name in existing_tables
+        and {col["name"] for col in inspector.get_columns(name)} == set(table.columns.keys())
+        for name, table in Base.metadata.tables.items()
+    )
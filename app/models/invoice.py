@@ -3,7 +3,7 @@ Invoice Database Model
 Stores all invoice information with relationships to users
 """
 
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Text, Boolean, JSON, Index, func
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from typing import List, Dict, Any
@@ -39,6 +39,12 @@ class Invoice(Base):
         notes: Additional notes
     """
     __tablename__ = "invoices"
+    __table_args__ = (
+        # Listing: WHERE user_id = ? [AND status = ?] ORDER BY created_at DESC
+        # Stats:   WHERE user_id = ? GROUP BY status / AND status = ?
+        Index("ix_invoices_user_status_created", "user_id", "status", "created_at"),
+        Index("ix_invoices_user_created", "user_id", "created_at"),
+    )
     
     # Primary Key
     id = Column(Integer, primary_key=True, index=True)
@@ -94,11 +100,11 @@ class Invoice(Base):
     internal_notes = Column(Text, nullable=True)  # Not shown to client
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)
     updated_at = Column(
-        DateTime, 
-        default=datetime.utcnow, 
-        onupdate=datetime.utcnow, 
+        DateTime(timezone=True), 
+        server_default=func.now(), 
+        onupdate=func.now(), 
         nullable=False
     )
     
@@ -175,8 +181,8 @@ class Invoice(Base):
     notes = Column(Text, nullable=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
     owner = relationship("User", back_populates="invoices")
@@ -2,9 +2,8 @@
 User Database Model
 """
 
-from sqlalchemy import Column, Integer, String, Boolean, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Index, func
 from sqlalchemy.orm import relationship
-from datetime import datetime
 from ..database import Base
 
 
@@ -12,8 +11,8 @@ class User(Base):
     __tablename__ = "users"
     
     id = Column(Integer, primary_key=True, index=True)
-    email = Column(String, unique=True, index=True, nullable=False)
-    username = Column(String, unique=True, index=True, nullable=False)
+    email = Column(String, nullable=False)
+    username = Column(String, nullable=False)
     hashed_password = Column(String, nullable=False)
     
     # User Info
@@ -30,11 +29,20 @@ class User(Base):
     is_verified = Column(Boolean, default=False)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
     
     # Relationships
+    # Lazy by default: when iterating several users' invoices, load them in one
+    # query with .options(selectinload(User.invoices)) instead of per-user SELECTs
     invoices = relationship("Invoice", back_populates="owner", cascade="all, delete-orphan")
     
+    # Indexes (declared after the columns they reference)
+    __table_args__ = (
+        # Case-insensitive uniqueness; lookups use func.lower(...) == value.lower()
+        Index("ix_users_email_lower", func.lower(email), unique=True),
+        Index("ix_users_username_lower", func.lower(username), unique=True),
+    )
+    
     def __repr__(self):
         return f"<User {self.username}>"
\ No newline at end of file
@@ -7,9 +7,11 @@ from .invoice import (
     InvoiceCreate,
     InvoiceUpdate,
     InvoiceResponse,
+    InvoiceListRow,
     InvoiceListResponse,
     EmailInvoice,
     InvoiceItem,
+    InvoiceItemResponse,
     LanguageEnum,
     CurrencyEnum,
     InvoiceStatusEnum
@@ -26,9 +28,11 @@ __all__ = [
     "InvoiceCreate",
     "InvoiceUpdate",
     "InvoiceResponse",
+    "InvoiceListRow",
     "InvoiceListResponse",
     "EmailInvoice",
     "InvoiceItem",
+    "InvoiceItemResponse",
     "LanguageEnum",
     "CurrencyEnum",
     "InvoiceStatusEnum",
@@ -3,13 +3,15 @@ Authentication Schemas
 Pydantic models for authentication requests/responses
 """
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional
+from .base import TrustedORMModel
+from .fields import FastEmail
 
 
 class UserRegister(BaseModel):
     """Schema for user registration"""
-    email: EmailStr
+    email: FastEmail
     username: str = Field(..., min_length=3, max_length=50)
     password: str = Field(..., min_length=8, max_length=100)
     full_name: Optional[str] = None
@@ -29,6 +31,8 @@ class Token(BaseModel):
     access_token: str
     token_type: str = "bearer"
     expires_in: int
+    
+    model_config = ConfigDict(frozen=True)
 
 
 class TokenData(BaseModel):
@@ -37,7 +41,7 @@ class TokenData(BaseModel):
     user_id: Optional[int] = None
 
 
-class UserResponse(BaseModel):
+class UserResponse(TrustedORMModel):
     """Schema for user information response"""
     id: int
     email: str
@@ -50,5 +54,4 @@ class UserResponse(BaseModel):
     is_active: bool
     is_verified: bool
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True)
\ No newline at end of file
@@ -0,0 +1,32 @@
+"""
+Shared Schema Base Classes
+"""
+
+from pydantic import BaseModel
+
+
+class TrustedORMModel(BaseModel):
+    """Response model that can be built from trusted ORM rows without validation"""
+
+    @classmethod
+    def from_orm_trusted(cls, obj):
+        """
+        Build an instance from an ORM object (or row) via model_construct
+
+        Database rows were validated on write, so read paths can skip
+        per-field validation. Models carrying their own validators fall
+        back to model_validate so those still run.
+        """
+        decorators = cls.__pydantic_decorators__
+        if decorators.field_validators or decorators.model_validators:
+            return cls.model_validate(obj)
+        return cls.model_construct(**cls._trusted_values(obj))
+
+    @classmethod
+    def _trusted_values(cls, obj) -> dict:
+        """Field values read off the object; missing attributes fall back to defaults"""
+        return {
+            name: getattr(obj, name)
+            for name in cls.model_fields
+            if hasattr(obj, name)
+        }
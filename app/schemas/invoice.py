@@ -3,36 +3,60 @@ Invoice Schemas
 Pydantic models for invoice requests/responses with full validation
 """
 
-from pydantic import BaseModel, EmailStr, Field, field_validator, model_validator
-from typing import Optional, List
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+from functools import cached_property
+from typing import Literal, Optional, List, Tuple
 from datetime import datetime
-from enum import Enum
+import re
+from .base import TrustedORMModel
+from .fields import FastEmail
+from ..config import settings
 
+# Optional leading "+", then digits mixed with spaces, dashes and parentheses
+# (at least one digit required)
+_PHONE_RE = re.compile(r"\+?[\d \-()]*\d[\d \-()]*")
 
-class LanguageEnum(str, Enum):
-    """Supported languages for invoices"""
-    ARABIC = "ar"
-    ENGLISH = "en"
+# Bound once so default_factory skips the attribute lookup per instance
+_utcnow = datetime.utcnow
 
 
-class CurrencyEnum(str, Enum):
-    """Supported currencies"""
-    MAD = "MAD"  # Moroccan Dirham
-    USD = "USD"  # US Dollar
-    EUR = "EUR"  # Euro
-    SAR = "SAR"  # Saudi Riyal
-    AED = "AED"  # UAE Dirham
-    GBP = "GBP"  # British Pound
-    EGP = "EGP"  # Egyptian Pound
+# Supported languages for invoices
+LanguageEnum = Literal["ar", "en"]
 
+# Supported currencies
+CurrencyEnum = Literal[
+    "MAD",  # Moroccan Dirham
+    "USD",  # US Dollar
+    "EUR",  # Euro
+    "SAR",  # Saudi Riyal
+    "AED",  # UAE Dirham
+    "GBP",  # British Pound
+    "EGP",  # Egyptian Pound
+]
 
-class InvoiceStatusEnum(str, Enum):
-    """Invoice status options"""
-    DRAFT = "draft"
-    SENT = "sent"
-    PAID = "paid"
-    CANCELLED = "cancelled"
-    OVERDUE = "overdue"
+# Invoice status options
+InvoiceStatusEnum = Literal["draft", "sent", "paid", "cancelled", "overdue"]
+
+# Config shared by every schema in this module; classes with OpenAPI
+# examples extend it with _examples(...)
+_SHARED_CONFIG = ConfigDict(str_strip_whitespace=True)
+
+# Response models are read from ORM objects and never modified afterwards
+_RESPONSE_CONFIG = ConfigDict(**_SHARED_CONFIG, from_attributes=True, frozen=True)
+
+
+def _examples(example: dict) -> dict:
+    """OpenAPI example config, omitted when settings.OPENAPI_EXAMPLES is off"""
+    if not settings.OPENAPI_EXAMPLES:
+        return {}
+    return {"json_schema_extra": example}
 
 
 class InvoiceItem(BaseModel):
@@ -42,21 +66,34 @@ class InvoiceItem(BaseModel):
     quantity: float = Field(..., gt=0, description="Quantity (must be > 0)")
     price: float = Field(..., ge=0, description="Unit price (must be >= 0)")
     
-    @property
+    @computed_field
+    @cached_property
     def total(self) -> float:
-        """Calculate item total"""
+        """Calculate item total (computed once per item)"""
         return round(self.quantity * self.price, 2)
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **_SHARED_CONFIG,
+        **_examples({
             "example": {
                 "name": "Web Development",
                 "description": "E-commerce website development",
                 "quantity": 1,
                 "price": 15000
             }
-        }
+        })
+    )
+
+
+class InvoiceItemResponse(BaseModel):
+    """Stored invoice item as returned in responses"""
+    name: str
+    description: Optional[str] = None
+    quantity: float
+    price: float
+    total: float
+    
+    model_config = _RESPONSE_CONFIG
 
 
 class InvoiceCreate(BaseModel):
@@ -69,7 +106,7 @@ class InvoiceCreate(BaseModel):
         max_length=200,
         description="Client's full name or company name"
     )
-    client_email: EmailStr = Field(..., description="Client's email address")
+    client_email: FastEmail = Field(..., description="Client's email address")
     client_phone: Optional[str] = Field(
         None,
         max_length=50,
@@ -88,11 +125,11 @@ class InvoiceCreate(BaseModel):
     
     # Invoice Settings
     language: LanguageEnum = Field(
-        default=LanguageEnum.ARABIC,
+        default="ar",
         description="Invoice language (ar or en)"
     )
     currency: CurrencyEnum = Field(
-        default=CurrencyEnum.MAD,
+        default="MAD",
         description="Currency code"
     )
     
@@ -118,9 +155,9 @@ class InvoiceCreate(BaseModel):
     )
     
     # Dates
-    issue_date: Optional[datetime] = Field(
-        default=None,
-        description="Issue date (defaults to now)"
+    issue_date: datetime = Field(
+        default_factory=_utcnow,
+        description="Issue date (defaults to now, UTC)"
     )
     due_date: Optional[datetime] = Field(
         None,
@@ -139,36 +176,25 @@ class InvoiceCreate(BaseModel):
         description="Internal notes (not shown to client)"
     )
     
-    @field_validator('items')
-    @classmethod
-    def validate_items(cls, v):
-        """Validate that at least one item is provided"""
-        if not v or len(v) == 0:
-            raise ValueError('At least one item is required')
-        return v
-    
     @field_validator('client_phone')
     @classmethod
     def validate_phone(cls, v):
         """Basic phone validation"""
-        if v:
-            # Remove spaces and common separators
-            cleaned = v.replace(" ", "").replace("-", "").replace("(", "").replace(")", "")
-            if not cleaned.replace("+", "").isdigit():
-                raise ValueError('Phone number must contain only digits, spaces, dashes, and + sign')
+        if v and not _PHONE_RE.fullmatch(v):
+            raise ValueError('Phone number must contain only digits, spaces, dashes, and + sign')
         return v
     
     @model_validator(mode='after')
     def validate_dates(self):
-        """Validate that due date is after issue date"""
-        if self.issue_date and self.due_date:
+        """Validate that due date is after an explicitly given issue date"""
+        if self.due_date and "issue_date" in self.model_fields_set:
             if self.due_date < self.issue_date:
                 raise ValueError('Due date must be after issue date')
         return self
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **_SHARED_CONFIG,
+        **_examples({
             "example": {
                 "client_name": "ACME Corporation",
                 "client_email": "billing@acme.com",
@@ -195,13 +221,14 @@ class InvoiceCreate(BaseModel):
                 "due_date": "2025-11-01T00:00:00",
                 "notes": "Payment due within 30 days"
             }
-        }
+        })
+    )
 
 
 class InvoiceUpdate(BaseModel):
     """Schema for updating invoice (partial update)"""
     client_name: Optional[str] = Field(None, min_length=1, max_length=200)
-    client_email: Optional[EmailStr] = None
+    client_email: Optional[FastEmail] = None
     client_phone: Optional[str] = Field(None, max_length=50)
     client_address: Optional[str] = Field(None, max_length=500)
     status: Optional[InvoiceStatusEnum] = None
@@ -209,17 +236,18 @@ class InvoiceUpdate(BaseModel):
     internal_notes: Optional[str] = Field(None, max_length=1000)
     due_date: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **_SHARED_CONFIG,
+        **_examples({
             "example": {
                 "status": "paid",
                 "notes": "Payment received via bank transfer"
             }
-        }
+        })
+    )
 
 
-class InvoiceResponse(BaseModel):
+class InvoiceResponse(TrustedORMModel):
     """Schema for invoice response with all details"""
     id: int
     invoice_number: str
@@ -233,11 +261,11 @@ class InvoiceResponse(BaseModel):
     client_tax_id: Optional[str] = None
     
     # Settings
-    language: str
-    currency: str
+    language: LanguageEnum
+    currency: CurrencyEnum
     
     # Items
-    items: List[dict]
+    items: List[InvoiceItemResponse]
     
     # Financial
     subtotal: float
@@ -257,7 +285,7 @@ class InvoiceResponse(BaseModel):
     payment_link: Optional[str] = None
     
     # Status
-    status: str
+    status: InvoiceStatusEnum
     is_sent_email: bool
     email_sent_at: Optional[datetime] = None
     paid_at: Optional[datetime] = None
@@ -270,9 +298,18 @@ class InvoiceResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    @classmethod
+    def _trusted_values(cls, invoice) -> dict:
+        """Also construct the stored JSON items without validation"""
+        values = super()._trusted_values(invoice)
+        values["items"] = [
+            InvoiceItemResponse.model_construct(**item) for item in invoice.items or []
+        ]
+        return values
+    
+    model_config = ConfigDict(
+        **_RESPONSE_CONFIG,
+        **_examples({
             "example": {
                 "id": 1,
                 "invoice_number": "INV-20251005-1234",
@@ -320,25 +357,41 @@ class InvoiceResponse(BaseModel):
                 "created_at": "2025-10-05T16:48:09.572Z",
                 "updated_at": "2025-10-05T16:48:09.572Z"
             }
-        }
+        })
+    )
+
+
+class InvoiceListRow(TrustedORMModel):
+    """Schema for a single row in the invoice list (summary fields only)"""
+    id: int
+    invoice_number: str
+    client_name: str
+    client_email: str
+    total: float
+    currency: CurrencyEnum
+    status: InvoiceStatusEnum
+    issue_date: datetime
+    due_date: Optional[datetime] = None
+    
+    model_config = _RESPONSE_CONFIG
 
 
 class InvoiceListResponse(BaseModel):
     """Schema for paginated invoice list"""
-    invoices: List[InvoiceResponse]
+    invoices: List[InvoiceListRow]
     total: int = Field(..., description="Total number of invoices")
     page: int = Field(..., ge=1, description="Current page number")
     page_size: int = Field(..., ge=1, le=100, description="Items per page")
-    total_pages: int = Field(..., description="Total number of pages")
     
-    @staticmethod
-    def calculate_total_pages(total: int, page_size: int) -> int:
+    @computed_field(description="Total number of pages")
+    @property
+    def total_pages(self) -> int:
         """Calculate total pages"""
-        return (total + page_size - 1) // page_size
+        return -(-self.total // self.page_size)  # ceil division
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **_RESPONSE_CONFIG,
+        **_examples({
             "example": {
                 "invoices": [
                     {
@@ -369,12 +422,13 @@ class InvoiceListResponse(BaseModel):
                 "page_size": 10,
                 "total_pages": 1
             }
-        }
+        })
+    )
 
 
 class EmailInvoice(BaseModel):
     """Schema for sending invoice via email"""
-    to_email: Optional[EmailStr] = Field(
+    to_email: Optional[FastEmail] = Field(
         None,
         description="Override recipient email (uses client_email if not provided)"
     )
@@ -388,22 +442,23 @@ class EmailInvoice(BaseModel):
         max_length=1000,
         description="Custom message to include in email"
     )
-    cc: Optional[List[EmailStr]] = Field(
+    cc: Optional[Tuple[FastEmail, ...]] = Field(
         None,
         max_length=5,
         description="CC recipients (max 5)"
     )
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **_SHARED_CONFIG,
+        **_examples({
             "example": {
                 "to_email": "custom@client.com",
                 "subject": "Your Invoice - Payment Due",
                 "message": "Thank you for your business! Payment is due within 30 days.",
                 "cc": ["accounting@company.com"]
             }
-        }
+        })
+    )
 
 
 class InvoiceStats(BaseModel):
@@ -417,9 +472,9 @@ class InvoiceStats(BaseModel):
     currency_breakdown: dict
     recent_invoices: List[InvoiceResponse]
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **_RESPONSE_CONFIG,
+        **_examples({
             "example": {
                 "total_invoices": 15,
                 "total_amount": 125000.0,
@@ -449,11 +504,14 @@ class InvoiceStats(BaseModel):
                     }
                 ]
             }
-        }
+        })
+    )
 
 
 class BulkInvoiceCreate(BaseModel):
     """Schema for creating multiple invoices at once"""
+    # Nested models are validated by the compiled core schema in one pass;
+    # wrapping this in a TypeAdapter would only validate the list twice
     invoices: List[InvoiceCreate] = Field(
         ...,
         min_length=1,
@@ -465,9 +523,9 @@ class BulkInvoiceCreate(BaseModel):
         description="Whether to send emails for all invoices"
     )
     
-    class Config:
-        from_attributes = True
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **_SHARED_CONFIG,
+        **_examples({
             "example": {
                 "invoices": [
                     {
@@ -487,7 +545,8 @@ class BulkInvoiceCreate(BaseModel):
                 ],
                 "send_emails": True
             }
-        }
+        })
+    )
 
 
 # Remove duplicate classes and keep only the enhanced versions
@@ -496,9 +555,11 @@ __all__ = [
     "CurrencyEnum", 
     "InvoiceStatusEnum",
     "InvoiceItem",
+    "InvoiceItemResponse",
     "InvoiceCreate",
     "InvoiceUpdate",
     "InvoiceResponse",
+    "InvoiceListRow",
     "InvoiceListResponse",
     "EmailInvoice",
     "InvoiceStats",
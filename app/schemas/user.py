@@ -4,9 +4,22 @@ Compatible with Pydantic v2
 """
 
 from pydantic import BaseModel, EmailStr, Field, field_validator
-from typing import Optional, List
+from typing import Optional
 from datetime import datetime
-from enum import Enum
+
+# Invoice schemas live in .invoice; re-exported here under their old names
+from .invoice import (  # noqa: F401
+    LanguageEnum as InvoiceLanguage,
+    CurrencyEnum as InvoiceCurrency,
+    InvoiceStatusEnum as InvoiceStatus,
+    InvoiceItem as InvoiceItemCreate,
+    InvoiceItemResponse,
+    InvoiceCreate,
+    InvoiceUpdate,
+    InvoiceResponse,
+    InvoiceListResponse,
+    EmailInvoice,
+)
 
 
 # ==========================================
@@ -136,181 +149,6 @@ class Token(BaseModel):
     expires_in: int = Field(default=1800, description="Token expiration time in seconds")
 
 
-# ==========================================
-# Invoice Schemas
-# ==========================================
-
-class InvoiceLanguage(str, Enum):
-    """Supported invoice languages"""
-    ENGLISH = "en"
-    ARABIC = "ar"
-    FRENCH = "fr"
-
-
-class InvoiceCurrency(str, Enum):
-    """Supported currencies"""
-    MAD = "MAD"
-    USD = "USD"
-    EUR = "EUR"
-    SAR = "SAR"
-    AED = "AED"
-    GBP = "GBP"
-    EGP = "EGP"
-
-
-class InvoiceStatus(str, Enum):
-    """Invoice status options"""
-    DRAFT = "draft"
-    SENT = "sent"
-    PAID = "paid"
-    CANCELLED = "cancelled"
-
-
-class InvoiceItemCreate(BaseModel):
-    """Schema for creating an invoice item"""
-    name: str = Field(..., min_length=1, max_length=200)
-    description: Optional[str] = Field(None, max_length=1000)
-    quantity: float = Field(..., gt=0, description="Quantity must be greater than 0")
-    price: float = Field(..., ge=0, description="Price must be 0 or greater")
-    
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "name": "Web Development Service",
-                "description": "Full-stack e-commerce platform",
-                "quantity": 1,
-                "price": 15000.00
-            }
-        }
-    }
-
-
-class InvoiceItemResponse(InvoiceItemCreate):
-    """Schema for invoice item response"""
-    id: int
-    invoice_id: int
-    total: float
-    
-    model_config = {"from_attributes": True}  # ✅ Fixed: was orm_mode in v1
-
-
-class InvoiceCreate(BaseModel):
-    """Schema for creating an invoice"""
-    client_name: str = Field(..., min_length=1, max_length=200)
-    client_email: EmailStr
-    client_phone: Optional[str] = Field(None, max_length=20)
-    client_address: Optional[str] = Field(None, max_length=500)
-    language: InvoiceLanguage = Field(default=InvoiceLanguage.ENGLISH)
-    currency: InvoiceCurrency = Field(default=InvoiceCurrency.USD)
-    items: List[InvoiceItemCreate] = Field(..., min_length=1)
-    tax_rate: float = Field(default=0, ge=0, le=100, description="Tax rate percentage (0-100)")
-    discount_rate: float = Field(default=0, ge=0, le=100, description="Discount rate percentage (0-100)")
-    due_date: Optional[datetime] = None
-    notes: Optional[str] = Field(None, max_length=2000)
-    
-    @field_validator('items')
-    @classmethod
-    def validate_items(cls, v):
-        """Ensure at least one item is provided"""
-        if not v or len(v) == 0:
-            raise ValueError('At least one item is required')
-        return v
-    
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "client_name": "ACME Corporation",
-                "client_email": "billing@acme.com",
-                "client_phone": "+1234567890",
-                "client_address": "123 Business Ave, New York, USA",
-                "language": "ar",
-                "currency": "MAD",
-                "items": [
-                    {
-                        "name": "تطوير موقع ويب",
-                        "description": "موقع تجارة إلكترونية كامل",
-                        "quantity": 1,
-                        "price": 15000.00
-                    }
-                ],
-                "tax_rate": 20.0,
-                "discount_rate": 10.0,
-                "due_date": "2025-11-10T00:00:00",
-                "notes": "شكراً لتعاملكم معنا"
-            }
-        }
-    }
-
-
-class InvoiceUpdate(BaseModel):
-    """Schema for updating an invoice"""
-    status: Optional[InvoiceStatus] = None
-    notes: Optional[str] = Field(None, max_length=2000)
-    
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "status": "paid",
-                "notes": "Payment received via bank transfer"
-            }
-        }
-    }
-
-
-class InvoiceResponse(BaseModel):
-    """Schema for invoice response"""
-    id: int
-    invoice_number: str
-    user_id: int
-    client_name: str
-    client_email: str
-    client_phone: Optional[str] = None
-    client_address: Optional[str] = None
-    language: str
-    currency: str
-    subtotal: float
-    tax_rate: float
-    tax_amount: float
-    discount_rate: float
-    discount_amount: float
-    total: float
-    status: str
-    due_date: Optional[datetime] = None
-    notes: Optional[str] = None
-    pdf_path: Optional[str] = None
-    qr_code_path: Optional[str] = None
-    created_at: datetime
-    updated_at: datetime
-    items: List[InvoiceItemResponse] = []
-    
-    model_config = {"from_attributes": True}  # ✅ Fixed: was orm_mode in v1
-
-
-class InvoiceListResponse(BaseModel):
-    """Schema for paginated invoice list"""
-    total: int
-    page: int
-    page_size: int
-    invoices: List[InvoiceResponse]
-
-
-class EmailInvoice(BaseModel):
-    """Schema for sending invoice via email"""
-    message: Optional[str] = Field(
-        None, 
-        max_length=1000,
-        description="Custom message to include in email"
-    )
-    
-    model_config = {
-        "json_schema_extra": {
-            "example": {
-                "message": "Thank you for your business! Please find your invoice attached."
-            }
-        }
-    }
-
-
 # ==========================================
 # Statistics Schemas
 # ==========================================
@@ -11,7 +11,7 @@ from .auth_service import (
 )
 from .pdf_service import pdf_generator
 from .qr_service import generate_qr_code, generate_invoice_qr
-from .email_service import send_email, send_invoice_email
+from .email_service import send_email, send_invoice_email, send_invoice_emails
 
 __all__ = [
     # Auth
@@ -28,4 +28,5 @@ __all__ = [
     # Email
     "send_email",
     "send_invoice_email",
+    "send_invoice_emails",
 ]
\ No newline at end of file
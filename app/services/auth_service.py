@@ -3,15 +3,22 @@ Authentication Service
 Handles password hashing, verification, and JWT token creation
 """
 
-from passlib.context import CryptContext
-from datetime import datetime, timedelta
-from jose import jwt, JWTError
-from typing import Optional
+from jose import jwk, jwt, JWTError
+from typing import Dict, Optional, Tuple
 import hashlib
+import time
+import bcrypt
 from ..config import settings
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# JWT signing key built once; passing a Key object lets jose skip
+# re-parsing SECRET_KEY on every encode/decode
+_JWT_ALGORITHM = settings.ALGORITHM
+_JWT_KEY = jwk.construct(settings.SECRET_KEY, _JWT_ALGORITHM)
+
+# Decoded-token cache: token -> (valid_until, payload)
+TOKEN_CACHE_TTL = 60.0
+TOKEN_CACHE_MAXSIZE = 10_000
+_TOKEN_CACHE: Dict[str, Tuple[float, dict]] = {}
 
 
 def hash_password(password: str) -> str:
@@ -33,18 +40,24 @@ def hash_password(password: str) -> str:
     Returns:
         Hashed password string
     """
+    password_bytes = password.encode('utf-8')
+
     # Pre-hash long passwords with SHA256 to fit bcrypt's 72-byte limit
-    if len(password.encode('utf-8')) > 72:
+    if len(password_bytes) > 72:
         # Hash password with SHA256 first (produces hex string of 64 chars)
-        password = hashlib.sha256(password.encode('utf-8')).hexdigest()
+        password_bytes = hashlib.sha256(password_bytes).hexdigest().encode('ascii')
 
-    return pwd_context.hash(password)
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password_bytes, salt).decode('utf-8')
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against its hash.
 
+    Accepts any bcrypt hash ($2a$/$2b$/$2y$), including those created
+    earlier through passlib; the cost factor is read from the hash itself.
+
     Args:
         plain_password: Plain text password to verify
         hashed_password: Hashed password from database
@@ -52,35 +65,35 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True if password matches, False otherwise
     """
+    password_bytes = plain_password.encode('utf-8')
+
     # Apply same pre-hashing logic as hash_password
-    if len(plain_password.encode('utf-8')) > 72:
-        plain_password = hashlib.sha256(
-            plain_password.encode('utf-8')).hexdigest()
+    if len(password_bytes) > 72:
+        password_bytes = hashlib.sha256(password_bytes).hexdigest().encode('ascii')
 
-    return pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(password_bytes, hashed_password.encode('utf-8'))
+    except ValueError:
+        # Not a bcrypt hash
+        return False
 
 
-def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
+def create_access_token(data: dict, expires_delta_seconds: Optional[int] = None) -> str:
     """
     Create a JWT access token.
 
     Args:
         data: Dictionary containing user data to encode
-        expires_delta: Optional token expiration time
+        expires_delta_seconds: Optional token lifetime in seconds
+            (defaults to ACCESS_TOKEN_EXPIRE_MINUTES)
 
     Returns:
         Encoded JWT token string
     """
-    to_encode = data.copy()
-
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    # "exp" is plain epoch seconds - no datetime arithmetic needed
+    lifetime = expires_delta_seconds or settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+    to_encode = {**data, "exp": int(time.time()) + lifetime}
+    encoded_jwt = jwt.encode(to_encode, _JWT_KEY, algorithm=_JWT_ALGORITHM)
 
     return encoded_jwt
 
@@ -89,15 +102,48 @@ def decode_access_token(token: str) -> Optional[dict]:
     """
     Decode and validate a JWT token.
 
+    Successfully decoded tokens are cached for TOKEN_CACHE_TTL seconds
+    (never past their own "exp"), so repeat requests with the same token
+    skip signature verification.
+
     Args:
         token: JWT token string
 
     Returns:
         Decoded token data if valid, None otherwise
     """
+    now = time.time()
+    cached = _TOKEN_CACHE.get(token)
+    if cached is not None:
+        valid_until, payload = cached
+        if now < valid_until:
+            return payload
+        del _TOKEN_CACHE[token]
+
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY,
-                             algorithms=[settings.ALGORITHM])
-        return payload
+        payload = jwt.decode(token, _JWT_KEY, algorithms=[_JWT_ALGORITHM])
     except JWTError:
         return None
+
+    if len(_TOKEN_CACHE) >= TOKEN_CACHE_MAXSIZE:
+        _TOKEN_CACHE.clear()
+    valid_until = now + TOKEN_CACHE_TTL
+    exp = payload.get("exp")
+    if isinstance(exp, (int, float)):
+        valid_until = min(valid_until, exp)
+    _TOKEN_CACHE[token] = (valid_until, payload)
+    return payload
+
+
+def generate_payment_link(user_id: int, username: str) -> str:
+    """
+    Build a user's unique payment link.
+
+    Args:
+        user_id: User's database ID
+        username: User's username
+
+    Returns:
+        Payment URL, e.g. https://example.com/pay/john_doe-1
+    """
+    return f"{settings.BASE_URL.rstrip('/')}/pay/{username}-{user_id}"
@@ -4,19 +4,93 @@ Handles sending emails with attachments using aiosmtplib
 Supports HTML emails with professional templates
 """
 
-import aiosmtplib
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
 from pathlib import Path
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
+from jinja2 import Environment, FileSystemLoader
+import asyncio
 import logging
 from ..config import settings
 
 # Setup logging
 logger = logging.getLogger(__name__)
 
+# Email templates, compiled once at import
+_env = Environment(
+    loader=FileSystemLoader(str(Path(__file__).parent.parent / "templates")),
+    autoescape=True,
+    auto_reload=False
+)
+_INVOICE_TEMPLATE = _env.get_template("email_invoice.html")
+_WELCOME_TEMPLATE = _env.get_template("email_welcome.html")
+
+# Shared SMTP session, reused across sends to skip the TCP/TLS handshake
+# and AUTH on every message. The lock serialises access to the session.
+_smtp = None
+_smtp_lock = asyncio.Lock()
+
+
+async def _get_smtp():
+    """
+    Return the shared SMTP client, connecting and logging in if needed
+
+    Must be called with _smtp_lock held.
+    """
+    import aiosmtplib
+    global _smtp
+
+    if _smtp is None or not _smtp.is_connected:
+        client = aiosmtplib.SMTP(
+            hostname=settings.SMTP_HOST,
+            port=settings.SMTP_PORT,
+            # Implicit TLS on 465; other ports upgrade via STARTTLS when offered
+            use_tls=settings.SMTP_PORT == 465,
+            timeout=30
+        )
+        try:
+            await client.connect()
+            if settings.SMTP_USER and settings.SMTP_PASSWORD:
+                await client.login(settings.SMTP_USER, settings.SMTP_PASSWORD)
+        except Exception:
+            # Don't leak a half-open connection (e.g. after a failed AUTH)
+            client.close()
+            raise
+        _smtp = client
+    return _smtp
+
+
+async def close_smtp() -> None:
+    """Close the shared SMTP session, if any (called on app shutdown)"""
+    import aiosmtplib
+    global _smtp
+
+    async with _smtp_lock:
+        if _smtp is not None and _smtp.is_connected:
+            try:
+                await _smtp.quit()
+            except aiosmtplib.SMTPException:
+                _smtp.close()
+        _smtp = None
+
+
+async def _send_message(message: MIMEMultipart) -> None:
+    """Send a message over the shared SMTP session, reconnecting once if dropped"""
+    import aiosmtplib
+    global _smtp
+
+    async with _smtp_lock:
+        smtp = await _get_smtp()
+        try:
+            await smtp.send_message(message)
+        except aiosmtplib.SMTPServerDisconnected:
+            # Server closed an idle session - open a fresh one and retry
+            _smtp = None
+            smtp = await _get_smtp()
+            await smtp.send_message(message)
+
 
 async def send_email(
     to_email: str,
@@ -45,6 +119,9 @@ async def send_email(
     Raises:
         Exception: If email sending fails critically
     """
+    # Deferred import keeps the SMTP client out of worker cold-start
+    import aiosmtplib
+    
     # Validate email format
     if not to_email or "@" not in to_email:
         logger.error(f"Invalid email address: {to_email}")
@@ -53,7 +130,7 @@ async def send_email(
     try:
         # Create message container
         message = MIMEMultipart("mixed")
-        message["From"] = f"{settings.EMAIL_FROM_NAME} <{settings.EMAIL_FROM}>"
+        message["From"] = f"{settings.SMTP_FROM_NAME} <{settings.SMTP_FROM_EMAIL}>"
         message["To"] = to_email
         message["Subject"] = subject
         
@@ -101,16 +178,8 @@ async def send_email(
                     logger.error(f"Failed to attach {file_path}: {str(e)}")
                     continue
         
-        # Send email via SMTP
-        await aiosmtplib.send(
-            message,
-            hostname=settings.EMAIL_HOST,
-            port=settings.EMAIL_PORT,
-            username=settings.EMAIL_USERNAME,
-            password=settings.EMAIL_PASSWORD,
-            use_tls=settings.EMAIL_USE_TLS,
-            timeout=30
-        )
+        # Send email via the shared SMTP session
+        await _send_message(message)
         
         logger.info(f"Email sent successfully to {to_email}")
         return True
@@ -152,151 +221,20 @@ async def send_invoice_email(
     Returns:
         True if sent successfully
     """
-    subject = f"Invoice {invoice_number} from {settings.EMAIL_FROM_NAME}"
-    
-    # Build payment section
-    payment_section = ""
-    if payment_link:
-        payment_section = f"""
-        <div style="margin: 30px 0; text-align: center; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 30px; border-radius: 10px;">
-            <p style="color: white; font-size: 18px; margin-bottom: 15px; font-weight: 600;">Ready to pay?</p>
-            <a href="{payment_link}" 
-               style="background-color: white; color: #667eea; padding: 15px 40px; 
-                      text-decoration: none; border-radius: 25px; display: inline-block;
-                      font-weight: bold; font-size: 16px; box-shadow: 0 4px 15px rgba(0,0,0,0.2);">
-                💳 Pay Invoice Now
-            </a>
-            <p style="color: white; font-size: 12px; margin-top: 15px; opacity: 0.9;">
-                Secure payment powered by {settings.APP_NAME}
-            </p>
-        </div>
-        """
-    
-    # Build custom message section (with HTML escaping for security)
-    custom_msg_section = ""
-    if custom_message:
-        # Basic HTML escaping to prevent injection
-        safe_message = (custom_message
-                       .replace("&", "&amp;")
-                       .replace("<", "&lt;")
-                       .replace(">", "&gt;")
-                       .replace('"', "&quot;")
-                       .replace("'", "&#x27;"))
-        custom_msg_section = f"""
-        <div style="background-color: #f8f9fa; padding: 20px; border-left: 4px solid #667eea; 
-                    margin: 25px 0; border-radius: 5px;">
-            <p style="margin: 0; color: #495057; line-height: 1.6; font-size: 15px;">
-                💬 <strong>Message from us:</strong><br>
-                {safe_message}
-            </p>
-        </div>
-        """
-    
-    # Build due date section
-    due_date_section = ""
-    if due_date:
-        due_date_section = f"""
-        <p style="background-color: #fff3cd; padding: 12px; border-radius: 5px; 
-                  border-left: 4px solid #ffc107; margin: 20px 0;">
-            ⏰ <strong>Due Date:</strong> {due_date}
-        </p>
-        """
+    subject = f"Invoice {invoice_number} from {settings.SMTP_FROM_NAME}"
     
-    # Create HTML email body
-    body = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Invoice {invoice_number}</title>
-    </head>
-    <body style="margin: 0; padding: 0; font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif; 
-                 background-color: #f4f4f4;">
-        <div style="max-width: 600px; margin: 20px auto; background-color: #ffffff; 
-                    border-radius: 10px; overflow: hidden; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-            
-            <!-- Header -->
-            <div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                        color: white; padding: 40px 30px; text-align: center;">
-                <h1 style="margin: 0 0 10px 0; font-size: 32px; font-weight: 700;">
-                    📄 New Invoice
-                </h1>
-                <p style="margin: 0; font-size: 16px; opacity: 0.9;">
-                    Invoice #{invoice_number}
-                </p>
-            </div>
-            
-            <!-- Content -->
-            <div style="padding: 40px 30px;">
-                <p style="font-size: 16px; color: #333; margin-top: 0;">
-                    Dear <strong>{client_name}</strong>,
-                </p>
-                
-                <p style="font-size: 15px; color: #666; line-height: 1.6;">
-                    Thank you for your business! Please find attached your invoice.
-                </p>
-                
-                {custom_msg_section}
-                
-                <!-- Invoice Details Box -->
-                <div style="background-color: #f8f9fa; padding: 25px; border-radius: 8px; 
-                            margin: 25px 0; border: 2px solid #e9ecef;">
-                    <table style="width: 100%; border-collapse: collapse;">
-                        <tr>
-                            <td style="padding: 10px 0; color: #666; font-size: 14px;">
-                                <strong>Invoice Number:</strong>
-                            </td>
-                            <td style="padding: 10px 0; text-align: right; color: #333; font-size: 14px;">
-                                {invoice_number}
-                            </td>
-                        </tr>
-                        <tr style="border-top: 1px solid #dee2e6;">
-                            <td style="padding: 10px 0; color: #666; font-size: 14px;">
-                                <strong>Total Amount:</strong>
-                            </td>
-                            <td style="padding: 10px 0; text-align: right; font-size: 20px; 
-                                       font-weight: bold; color: #667eea;">
-                                {total:.2f} {currency}
-                            </td>
-                        </tr>
-                    </table>
-                </div>
-                
-                {due_date_section}
-                
-                {payment_section}
-                
-                <div style="margin-top: 30px; padding-top: 20px; border-top: 2px solid #e9ecef;">
-                    <p style="font-size: 14px; color: #666; margin-bottom: 10px;">
-                        🔍 Your invoice is attached as a PDF file.
-                    </p>
-                    <p style="font-size: 14px; color: #666; margin: 0;">
-                        If you have any questions, please don't hesitate to contact us.
-                    </p>
-                </div>
-                
-                <p style="font-size: 15px; color: #333; margin-top: 30px;">
-                    Best regards,<br>
-                    <strong style="color: #667eea;">{settings.EMAIL_FROM_NAME}</strong>
-                </p>
-            </div>
-            
-            <!-- Footer -->
-            <div style="background-color: #f8f9fa; padding: 25px 30px; text-align: center; 
-                        border-top: 1px solid #e9ecef;">
-                <p style="margin: 0 0 5px 0; color: #999; font-size: 12px;">
-                    This is an automated email from {settings.APP_NAME}
-                </p>
-                <p style="margin: 0; color: #999; font-size: 12px;">
-                    Please do not reply directly to this email.
-                </p>
-            </div>
-            
-        </div>
-    </body>
-    </html>
-    """
+    # Render HTML email body (autoescaped, so user-supplied text is safe)
+    body = _INVOICE_TEMPLATE.render(
+        invoice_number=invoice_number,
+        client_name=client_name,
+        total=total,
+        currency=currency,
+        payment_link=payment_link,
+        custom_message=custom_message,
+        due_date=due_date,
+        from_name=settings.SMTP_FROM_NAME,
+        app_name=settings.APP_NAME,
+    )
     
     return await send_email(
         to_email=to_email,
@@ -307,6 +245,36 @@ async def send_invoice_email(
     )
 
 
+async def send_invoice_emails(jobs: List[Dict[str, Any]], concurrency: int = 8) -> List[bool]:
+    """
+    Send many invoice emails concurrently
+    
+    Message building (template rendering, reading and encoding the PDF)
+    overlaps across jobs; the SMTP transactions themselves go through the
+    shared session one at a time. Set concurrency to what the SMTP server
+    accepts per connection.
+    
+    Args:
+        jobs: Keyword arguments for send_invoice_email, one dict per email
+        concurrency: Maximum number of sends in flight
+        
+    Returns:
+        Send result per job, in the same order as jobs
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    
+    async def _send_one(job: Dict[str, Any]) -> bool:
+        async with semaphore:
+            # One failing job must not abort gather and drop the others
+            try:
+                return await send_invoice_email(**job)
+            except Exception as e:
+                logger.error(f"Failed to send invoice email to {job.get('to_email')}: {str(e)}")
+                return False
+    
+    return list(await asyncio.gather(*(_send_one(job) for job in jobs)))
+
+
 async def send_welcome_email(to_email: str, username: str, full_name: Optional[str] = None) -> bool:
     """
     Send welcome email to new user
@@ -322,42 +290,11 @@ async def send_welcome_email(to_email: str, username: str, full_name: Optional[s
     display_name = full_name or username
     subject = f"Welcome to {settings.APP_NAME}! 🎉"
     
-    body = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-    </head>
-    <body style="font-family: Arial, sans-serif; line-height: 1.6; color: #333;">
-        <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-            <h1 style="color: #667eea;">Welcome to {settings.APP_NAME}!</h1>
-            
-            <p>Hi {display_name},</p>
-            
-            <p>Thank you for signing up! Your account has been created successfully.</p>
-            
-            <p><strong>Your username:</strong> {username}</p>
-            
-            <p>You can now start creating professional invoices in just a few clicks!</p>
-            
-            <div style="margin: 30px 0; padding: 20px; background-color: #f8f9fa; border-radius: 5px;">
-                <h3 style="margin-top: 0;">Quick Start:</h3>
-                <ol>
-                    <li>Login to your account</li>
-                    <li>Create your first invoice</li>
-                    <li>Send it to your client via email</li>
-                    <li>Get paid!</li>
-                </ol>
-            </div>
-            
-            <p>If you have any questions, feel free to contact us.</p>
-            
-            <p>Best regards,<br>
-            <strong>{settings.APP_NAME} Team</strong></p>
-        </div>
-    </body>
-    </html>
-    """
+    body = _WELCOME_TEMPLATE.render(
+        display_name=display_name,
+        username=username,
+        app_name=settings.APP_NAME,
+    )
     
     return await send_email(
         to_email=to_email,
@@ -3,21 +3,37 @@ PDF Generation Service
 Creates professional invoices using WeasyPrint and Jinja2
 """
 
+import asyncio
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader
-from weasyprint import HTML, CSS
 from datetime import datetime
 from typing import List, Dict, Optional
 from ..config import settings
+from ..utils.helpers import calculate_invoice_totals
+
+
+# Invoice template per language
+TEMPLATES = {
+    "en": "template_english.html",
+    "ar": "template_arabic.html",
+}
 
 
 class PDFGenerator:
     """PDF Generator for invoices"""
     
     def __init__(self):
-        # Setup Jinja2 environment
+        # Setup Jinja2 environment (templates ship with the app, so skip
+        # the per-render mtime check and compile them once up front)
         template_dir = Path(__file__).parent.parent / "templates"
-        self.env = Environment(loader=FileSystemLoader(str(template_dir)))
+        self.env = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            auto_reload=False
+        )
+        self._templates = {
+            language: self.env.get_template(name)
+            for language, name in TEMPLATES.items()
+        }
         
         # Ensure output directory exists
         self.output_dir = Path(settings.UPLOAD_DIR)
@@ -40,21 +56,7 @@ class PDFGenerator:
         Returns:
             Dictionary with subtotal, tax, discount, and total
         """
-        subtotal = sum(item.get("total", 0) for item in items)
-        
-        discount_amount = round(subtotal * (discount_rate / 100), 2)
-        subtotal_after_discount = subtotal - discount_amount
-        
-        tax_amount = round(subtotal_after_discount * (tax_rate / 100), 2)
-        
-        total = round(subtotal_after_discount + tax_amount, 2)
-        
-        return {
-            "subtotal": subtotal,
-            "discount_amount": discount_amount,
-            "tax_amount": tax_amount,
-            "total": total
-        }
+        return calculate_invoice_totals(items, tax_rate, discount_rate)
     
     def format_date(self, date: datetime, language: str = "en") -> str:
         """Format date based on language"""
@@ -96,8 +98,7 @@ class PDFGenerator:
         totals = self.calculate_totals(items, tax_rate, discount_rate)
         
         # Select template based on language
-        template_name = f"invoice_{language}.html"
-        template = self.env.get_template(template_name)
+        template = self._templates[language]
         
         # Prepare template context
         context = {
@@ -142,7 +143,9 @@ class PDFGenerator:
         # Render HTML
         html_content = template.render(context)
         
-        # Generate PDF
+        # Generate PDF (WeasyPrint pulls in pango/cairo, so import it on first use)
+        from weasyprint import HTML
+        
         output_filename = f"invoice_{invoice_number}.pdf"
         output_path = self.output_dir / output_filename
         
@@ -151,6 +154,16 @@ class PDFGenerator:
         )
         
         return str(output_path)
+    
+    async def generate_invoice_pdf_async(self, **kwargs) -> str:
+        """
+        Generate invoice PDF in a worker thread
+        
+        WeasyPrint rendering is CPU-heavy and synchronous; running it via
+        asyncio.to_thread keeps the event loop free for other requests.
+        Accepts the same keyword arguments as generate_invoice_pdf.
+        """
+        return await asyncio.to_thread(self.generate_invoice_pdf, **kwargs)
 
 
 # Global instance
@@ -2,19 +2,27 @@
 QR Code Generation Service
 """
 
-import qrcode
+import hashlib
 import os
 from pathlib import Path
 from ..config import settings
 
 
-def generate_qr_code(data: str, filename: str) -> str:
+def generate_qr_code(data: str, filename: str, ec: str = "M", box_size: int = 6) -> str:
     """
     Generate QR code image
     
+    The image file name carries a hash of the encoded data and the render
+    settings (ec, box_size), so a QR code that already exists for the same
+    inputs is reused instead of redrawn.
+    
     Args:
         data: Data to encode (usually payment link)
-        filename: Output filename (without extension)
+        filename: Output filename prefix (without extension)
+        ec: Error correction level - "L", "M", "Q" or "H" (default: "M",
+            enough for short payment URLs)
+        box_size: Pixels per QR module (default: 6; the PDF template
+            shows the code at up to 200px)
         
     Returns:
         Path to generated QR code image
@@ -23,11 +31,20 @@ def generate_qr_code(data: str, filename: str) -> str:
     qr_dir = Path(settings.QR_DIR)
     qr_dir.mkdir(parents=True, exist_ok=True)
     
+    cache_key = f"{ec}:{box_size}:{data}"
+    data_hash = hashlib.blake2b(cache_key.encode("utf-8"), digest_size=8).hexdigest()
+    output_path = qr_dir / f"{filename}_{data_hash}.png"
+    if output_path.exists():
+        return str(output_path)
+    
+    # qrcode/Pillow are heavy to import, so defer them until a QR is needed
+    import qrcode
+    
     # Create QR code
     qr = qrcode.QRCode(
         version=1,
-        error_correction=qrcode.constants.ERROR_CORRECT_H,
-        box_size=10,
+        error_correction=getattr(qrcode.constants, f"ERROR_CORRECT_{ec}"),
+        box_size=box_size,
         border=4,
     )
     
@@ -37,9 +54,8 @@ def generate_qr_code(data: str, filename: str) -> str:
     # Generate image
     img = qr.make_image(fill_color="black", back_color="white")
     
-    # Save image
-    output_path = qr_dir / f"{filename}.png"
-    img.save(str(output_path))
+    # Save image; light zlib compression is plenty for a two-colour image
+    img.save(str(output_path), compress_level=1)
     
     return str(output_path)
 
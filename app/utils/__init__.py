@@ -7,6 +7,7 @@ from .helpers import (
     generate_invoice_number,
     format_currency,
     validate_email_rate_limit,
+    record_email_sent,
     sanitize_filename
 )
 
@@ -18,5 +19,6 @@ __all__ = [
     "generate_invoice_number",
     "format_currency",
     "validate_email_rate_limit",
+    "record_email_sent",
     "sanitize_filename",
 ]
\ No newline at end of file
@@ -5,18 +5,19 @@ Reusable dependencies for authentication and database access
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import func
+from sqlalchemy.orm import Session, raiseload
 from typing import Optional
 from ..database import get_db
 from ..models.user import User
 from ..services.auth_service import decode_access_token
 
-# Security scheme
-security = HTTPBearer()
+# Security scheme (missing credentials are reported as 401 below, not 403)
+security = HTTPBearer(auto_error=False)
 
 
 async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
     db: Session = Depends(get_db)
 ) -> User:
     """
@@ -25,21 +26,31 @@ async def get_current_user(
     Raises:
         HTTPException: If token is invalid or user not found
     """
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    
     # Extract token
     token = credentials.credentials
     
-    # Decode token
+    # Decode token (payload dict; the username is in "sub")
     token_data = decode_access_token(token)
+    username = token_data.get("sub") if token_data else None
     
-    if token_data is None:
+    if username is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Get user from database
-    user = db.query(User).filter(User.username == token_data.username).first()
+    # Get user from database (invoices are never needed here; fail fast if touched)
+    user = db.query(User).options(
+        raiseload(User.invoices)
+    ).filter(func.lower(User.username) == username.lower()).first()
     
     if user is None:
         raise HTTPException(
@@ -3,13 +3,47 @@ Helper Utilities
 Common utility functions used across the application
 """
 
+import math
 import random
+import secrets
 import string
 import re
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, List
 from decimal import Decimal, ROUND_HALF_UP
 
+# Anything outside [A-Za-z0-9-_.]; underscores are included so that runs
+# like "a _#b" collapse to a single "_" in one pass
+_UNSAFE_FILENAME_RE = re.compile(r'[^A-Za-z0-9.\-]+')
+
+# Currency display symbols; currencies in _PREFIX_CURRENCIES put the
+# symbol before the amount, the rest after
+_CURRENCY_SYMBOLS = {
+    "MAD": "DH",
+    "USD": "$",
+    "EUR": "€",
+    "SAR": "SAR",
+    "AED": "AED",
+    "GBP": "£",
+    "JPY": "¥"
+}
+_PREFIX_CURRENCIES = frozenset({"USD", "EUR", "GBP"})
+
+_MONTHS_AR = (
+    "يناير", "فبراير", "مارس", "أبريل", "مايو", "يونيو",
+    "يوليو", "أغسطس", "سبتمبر", "أكتوبر", "نوفمبر", "ديسمبر"
+)
+
+# Recent email send times (epoch seconds) per user, used by the rate
+# limiter instead of counting invoices on every request. Each user's
+# entry is seeded from the database on first check, then kept current
+# by record_email_sent(); the invoices table remains the audit trail.
+# Entries are dropped once their window is empty and the whole map is
+# cleared when full - a dropped user is simply re-seeded on next check.
+EMAIL_SENDS_MAXSIZE = 10_000
+_EMAIL_SENDS: Dict[int, List[float]] = {}
+
 
 def generate_invoice_number(prefix: str = "INV", user_id: Optional[int] = None) -> str:
     """
@@ -17,7 +51,8 @@ def generate_invoice_number(prefix: str = "INV", user_id: Optional[int] = None)
     Format: INV-YYYYMMDD-XXXX or INV-YYYYMMDD-UID-XXXX
     """
     date_str = datetime.now().strftime("%Y%m%d")
-    random_str = ''.join(random.choices(string.digits, k=4))
+    # One 4-digit draw instead of four per-character random.choices picks
+    random_str = f"{secrets.randbelow(10000):04d}"
 
     if user_id:
         return f"{prefix}-{date_str}-{user_id}-{random_str}"
@@ -28,23 +63,13 @@ def format_currency(amount: float, currency: str, include_symbol: bool = True) -
     """
     Format amount with currency symbol
     """
-    symbols = {
-        "MAD": "DH",
-        "USD": "$",
-        "EUR": "€",
-        "SAR": "SAR",
-        "AED": "AED",
-        "GBP": "£",
-        "JPY": "¥"
-    }
-
     # Format with thousand separators
     formatted_amount = f"{amount:,.2f}"
 
     if include_symbol:
-        symbol = symbols.get(currency, currency)
-        # Dollar and Euro before amount, others after
-        if currency in ["USD", "EUR", "GBP"]:
+        symbol = _CURRENCY_SYMBOLS.get(currency, currency)
+        # Dollar, Euro and Pound before amount, others after
+        if currency in _PREFIX_CURRENCIES:
             return f"{symbol}{formatted_amount}"
         return f"{formatted_amount} {symbol}"
 
@@ -61,15 +86,29 @@ def validate_email_rate_limit(user_id: int, db_session, hours: int = 1, limit: i
     if limit is None:
         limit = settings.EMAIL_RATE_LIMIT
 
-    # Calculate time threshold
-    time_threshold = datetime.utcnow() - timedelta(hours=hours)
-
-    # Count emails sent in time window
-    count = db_session.query(Invoice).filter(
-        Invoice.user_id == user_id,
-        Invoice.is_sent_email == True,
-        Invoice.email_sent_at >= time_threshold
-    ).count()
+    window_start = time.time() - hours * 3600
+
+    sends = _EMAIL_SENDS.get(user_id)
+    if sends is None:
+        # First check for this user in this process - seed from the DB
+        time_threshold = datetime.utcnow() - timedelta(hours=hours)
+        rows = db_session.query(Invoice.email_sent_at).filter(
+            Invoice.user_id == user_id,
+            Invoice.is_sent_email == True,
+            Invoice.email_sent_at >= time_threshold
+        ).all()
+        # email_sent_at is naive UTC; without tzinfo, timestamp() would
+        # read it as local time and shift the window by the UTC offset
+        sends = [sent_at.replace(tzinfo=timezone.utc).timestamp() for (sent_at,) in rows]
+        if len(_EMAIL_SENDS) >= EMAIL_SENDS_MAXSIZE:
+            _EMAIL_SENDS.clear()
+        _EMAIL_SENDS[user_id] = sends
+
+    # Drop sends that have left the window
+    sends[:] = [t for t in sends if t >= window_start]
+    count = len(sends)
+    if not sends:
+        del _EMAIL_SENDS[user_id]
 
     remaining = max(0, limit - count)
     allowed = count < limit
@@ -83,18 +122,22 @@ def validate_email_rate_limit(user_id: int, db_session, hours: int = 1, limit: i
     }
 
 
-def sanitize_filename(filename: str, max_length: int = 255) -> str:
+def record_email_sent(user_id: int) -> None:
     """
-    Remove unsafe characters from filename
+    Count an email send towards the user's rate limit
     """
-    # Define safe characters
-    safe_chars = string.ascii_letters + string.digits + "-_."
+    # Users not seen yet are seeded from the DB on their next check
+    sends = _EMAIL_SENDS.get(user_id)
+    if sends is not None:
+        sends.append(time.time())
 
-    # Replace unsafe characters with underscore
-    sanitized = ''.join(c if c in safe_chars else '_' for c in filename)
 
-    # Remove multiple consecutive underscores
-    sanitized = re.sub(r'_+', '_', sanitized)
+def sanitize_filename(filename: str, max_length: int = 255) -> str:
+    """
+    Remove unsafe characters from filename
+    """
+    # Replace runs of unsafe characters (and underscores) with one underscore
+    sanitized = _UNSAFE_FILENAME_RE.sub('_', filename)
 
     # Trim to max length
     if len(sanitized) > max_length:
@@ -109,21 +152,67 @@ def sanitize_filename(filename: str, max_length: int = 255) -> str:
 def calculate_invoice_totals(
     items: list,
     tax_rate: float = 0.0,
-    discount_rate: float = 0.0
+    discount_rate: float = 0.0,
+    use_decimal: bool = False
 ) -> Dict[str, float]:
     """
     Calculate invoice totals with tax and discount
+
+    Uses float arithmetic with half-up rounding to cents; pass
+    use_decimal=True for exact Decimal arithmetic. Both give the same
+    result: the subtotal is rounded to cents first, so the returned
+    subtotal - discount + tax always equals the total.
+    """
+    if use_decimal:
+        return _calculate_invoice_totals_decimal(items, tax_rate, discount_rate)
+
+    # Calculate subtotal (single pass)
+    subtotal = 0.0
+    for item in items:
+        subtotal += item.get('quantity', 0) * item.get('price', 0)
+    subtotal = _round_half_up(subtotal)
+
+    # Calculate discount, then tax on the discounted amount
+    discount_amount = _round_half_up(subtotal * discount_rate / 100)
+    subtotal_after_discount = subtotal - discount_amount
+    tax_amount = _round_half_up(subtotal_after_discount * tax_rate / 100)
+
+    return {
+        "subtotal": subtotal,
+        "discount_amount": discount_amount,
+        "tax_amount": tax_amount,
+        "total": _round_half_up(subtotal_after_discount + tax_amount)
+    }
+
+
+def _round_half_up(value: float) -> float:
+    """Round to 2 decimal places, halves away from zero (for non-negative amounts)"""
+    # Rounding to 6 places first absorbs binary representation error
+    # (e.g. 1.005 * 100 == 100.49999999999999)
+    return math.floor(round(value * 100, 6) + 0.5) / 100
+
+
+def _calculate_invoice_totals_decimal(
+    items: list,
+    tax_rate: float,
+    discount_rate: float
+) -> Dict[str, float]:
+    """
+    Calculate invoice totals with exact Decimal arithmetic
     """
+    cent = Decimal('0.01')
+
     # Calculate subtotal
     subtotal = sum(
         Decimal(str(item.get('quantity', 0))) *
         Decimal(str(item.get('price', 0)))
         for item in items
     )
+    subtotal = Decimal(subtotal).quantize(cent, rounding=ROUND_HALF_UP)
 
     # Calculate discount
     discount_amount = (subtotal * Decimal(str(discount_rate)) / Decimal('100')).quantize(
-        Decimal('0.01'), rounding=ROUND_HALF_UP
+        cent, rounding=ROUND_HALF_UP
     )
 
     # Subtotal after discount
@@ -131,7 +220,7 @@ def calculate_invoice_totals(
 
     # Calculate tax on discounted amount
     tax_amount = (subtotal_after_discount * Decimal(str(tax_rate)) / Decimal('100')).quantize(
-        Decimal('0.01'), rounding=ROUND_HALF_UP
+        cent, rounding=ROUND_HALF_UP
     )
 
     # Calculate total
@@ -161,11 +250,7 @@ def format_date(
         if format_type == "short":
             return date.strftime("%d/%m/%Y")
         else:  # long
-            months_ar = [
-                "يناير", "فبراير", "مارس", "أبريل", "مايو", "يونيو",
-                "يوليو", "أغسطس", "سبتمبر", "أكتوبر", "نوفمبر", "ديسمبر"
-            ]
-            return f"{date.day} {months_ar[date.month - 1]} {date.year}"
+            return f"{date.day} {_MONTHS_AR[date.month - 1]} {date.year}"
     else:  # English
         if format_type == "short":
             return date.strftime("%m/%d/%Y")
@@ -1,34 +1,83 @@
+import hashlib
 import json
 import os
 import subprocess
 
+try:
+    import orjson  # أسرع بكثير في قراءة/كتابة ملفات OpenAPI الكبيرة
+except ImportError:
+    orjson = None
+
 # 🔧 إعدادات عامة
 OPENAPI_FILE = "openapi.json"
 OUTPUT_FILE = "openapi_ready.json"
 BASE_URL = "https://screeching-tildi-adelzidoune-ca9a7151.koyeb.app"
 RAPIDAPI_API_KEY = os.getenv("RAPIDAPI_API_KEY")  # ضع المفتاح هنا أو في البيئة
+HASH_FILE = ".openapi_ready.hash"  # بصمة آخر مدخلات تمت معالجتها
+
+# مفاتيح العمليات داخل Path Item حسب مواصفة OpenAPI
+HTTP_METHODS = frozenset({
+    "get", "put", "post", "delete", "options", "head", "patch", "trace"
+})
 
 def inject_base_url(data):
     """إضافة x-rapidapi-base-url لكل endpoint"""
-    paths = data.get("paths", {})
-    for path, methods in paths.items():
+    base_url = BASE_URL
+    for methods in data.get("paths", {}).values():
         for method, details in methods.items():
-            if isinstance(details, dict):
-                details["x-rapidapi-base-url"] = BASE_URL
+            # مفاتيح مثل "parameters" و"summary" ليست عمليات
+            if method in HTTP_METHODS:
+                details["x-rapidapi-base-url"] = base_url
     return data
 
+def load_json(path):
+    """قراءة ملف JSON (orjson إن وُجد، وإلا json القياسي)"""
+    if orjson is not None:
+        with open(path, "rb") as f:
+            return orjson.loads(f.read())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def dump_json(data, path):
+    """كتابة ملف JSON بمسافة بادئة 2 ومع الإبقاء على الأحرف غير ASCII"""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+def input_hash():
+    """بصمة ملف OpenAPI مع BASE_URL (المخرجات تعتمد عليهما فقط)"""
+    with open(OPENAPI_FILE, "rb") as f:
+        digest = hashlib.blake2b(f.read())
+    digest.update(BASE_URL.encode("utf-8"))
+    return digest.hexdigest()
+
+def output_is_current(current_hash):
+    """هل تم توليد OUTPUT_FILE من نفس المدخلات؟"""
+    if not (os.path.exists(OUTPUT_FILE) and os.path.exists(HASH_FILE)):
+        return False
+    with open(HASH_FILE, "r", encoding="utf-8") as f:
+        return f.read().strip() == current_hash
+
 def main():
-    print("🔍 قراءة ملف OpenAPI...")
-    with open(OPENAPI_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    # ⚡ لا داعي لإعادة التوليد إذا لم تتغير المدخلات
+    current_hash = input_hash()
+    if output_is_current(current_hash):
+        print(f"✅ cache hit: {OUTPUT_FILE} محدّث بالفعل")
+    else:
+        print("🔍 قراءة ملف OpenAPI...")
+        data = load_json(OPENAPI_FILE)
 
-    # 🧩 إضافة base URL في كل endpoint
-    data = inject_base_url(data)
+        # 🧩 إضافة base URL في كل endpoint
+        data = inject_base_url(data)
 
-    # 💾 حفظ الملف الجديد
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-    print(f"✅ تم إنشاء الملف الجديد: {OUTPUT_FILE}")
+        # 💾 حفظ الملف الجديد
+        dump_json(data, OUTPUT_FILE)
+        with open(HASH_FILE, "w", encoding="utf-8") as f:
+            f.write(current_hash)
+        print(f"✅ تم إنشاء الملف الجديد: {OUTPUT_FILE}")
 
     # 🚀 رفع الملف تلقائيًا (اختياري)
     if RAPIDAPI_API_KEY:
@@ -38,7 +87,7 @@ def main():
             "--apiKey", RAPIDAPI_API_KEY,
             "--file", OUTPUT_FILE,
             "--base", BASE_URL
-        ])
+        ], env={**os.environ, "NPM_CONFIG_UPDATE_NOTIFIER": "false"})  # بدون فحص تحديثات npm
     else:
         print("⚠️ لم يتم العثور على RAPIDAPI_API_KEY، تم فقط إنشاء الملف دون رفعه.")
 
@@ -1,17 +1,18 @@
-cat > test_health.py << 'EOF'
-import requests
+import httpx
 
-def test_health():
+# عميل مشترك: اتصال واحد يُعاد استخدامه بين الطلبات
+client = httpx.Client(base_url="http://localhost:8000", timeout=5.0)
+
+def check_health():
     """اختبر إذا كان الخادم يعمل"""
-    url = "http://localhost:8000/health"
     
     print("🏥 Testing server health...")
     
     try:
-        response = requests.get(url, timeout=5)
+        response = client.get("/health")
         print(f"✅ Health check: {response.status_code} - {response.text}")
         return True
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("❌ Server is not running! Start with: uvicorn app.main:app --reload")
         return False
     except Exception as e:
@@ -19,5 +20,4 @@ def test_health():
         return False
 
 if __name__ == "__main__":
-    test_health()
-EOF
\ No newline at end of file
+    check_health()
@@ -1,10 +1,11 @@
-cat > test_register.py << 'EOF'
-import requests
-import json
+import httpx
+import orjson
 
-def test_register():
+# عميل مشترك: اتصال واحد يُعاد استخدامه بين الطلبات
+client = httpx.Client(base_url="http://localhost:8000", timeout=10.0)
+
+def check_register():
     """اختبر عملية التسجيل"""
-    url = "http://localhost:8000/auth/register"
     
     # بيانات بسيطة للتسجيل
     data = {
@@ -15,17 +16,17 @@ def test_register():
     }
     
     print("🔄 Testing user registration...")
-    print(f"📤 Sending data: {json.dumps(data, indent=2)}")
+    print(f"📤 Sending data: {orjson.dumps(data, option=orjson.OPT_INDENT_2).decode()}")
     
     try:
-        response = requests.post(url, json=data, timeout=10)
+        response = client.post("/auth/register", json=data)
         
         print(f"📥 Status Code: {response.status_code}")
         print(f"📄 Response: {response.text}")
         
         if response.status_code == 201:
             print("🎉 SUCCESS! User registered successfully!")
-            result = response.json()
+            result = orjson.loads(response.content)
             print(f"👤 User created with ID: {result.get('id', 'N/A')}")
         elif response.status_code == 500:
             print("❌ Internal Server Error - Check server logs")
@@ -34,13 +35,12 @@ def test_register():
         else:
             print(f"❌ Unexpected status: {response.status_code}")
             
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("🚫 Connection Error - Is the server running?")
-    except requests.exceptions.Timeout:
+    except httpx.TimeoutException:
         print("⏰ Request Timeout - Server took too long to respond")
     except Exception as e:
         print(f"💥 Unexpected error: {e}")
 
 if __name__ == "__main__":
-    test_register()
-EOF
\ No newline at end of file
+    check_register()
@@ -1,21 +1,20 @@
 import sys
 import os
 import subprocess
+import importlib.util
 
 print("🔧 Starting comprehensive fix...")
 
 # 1. تحقق من التبعيات
 print("📦 Checking dependencies...")
-try:
-    import requests
-    import sqlalchemy
-    import jose
-    import passlib
-    import pydantic
+# find_spec يتحقق من وجود الحزمة دون استيرادها (أسرع بكثير)
+REQUIRED_MODULES = ("httpx", "sqlalchemy", "jose", "bcrypt", "pydantic")
+missing = [name for name in REQUIRED_MODULES if importlib.util.find_spec(name) is None]
+if missing:
+    print(f"❌ Missing dependency: {', '.join(missing)}")
+    print("Run: pip install httpx sqlalchemy python-jose[cryptography] bcrypt pydantic")
+else:
     print("✅ All dependencies are installed")
-except ImportError as e:
-    print(f"❌ Missing dependency: {e}")
-    print("Run: pip install requests sqlalchemy python-jose[cryptography] passlib[bcrypt] pydantic")
 
 # 2. إنشاء المجلدات
 print("📁 Creating directories...")
@@ -23,16 +22,20 @@ os.makedirs("uploads", exist_ok=True)
 os.makedirs("app/schemas", exist_ok=True)
 print("✅ Directories created")
 
-# 3. إعادة إنشاء قاعدة البيانات
-print("🗄️ Recreating database...")
+# 3. إعادة إنشاء قاعدة البيانات (فقط إذا اختلف المخطط)
+print("🗄️ Checking database schema...")
 try:
-    from app.database import engine, Base
+    from app.database import engine, Base, schema_matches
     from app.models.user import User
     from app.models.invoice import Invoice
     
-    Base.metadata.drop_all(bind=engine)
-    Base.metadata.create_all(bind=engine)
-    print("✅ Database recreated successfully")
+    # قارن أعمدة كل جدول في قاعدة البيانات مع أعمدة النماذج
+    if schema_matches(engine):
+        print("✅ Database schema is up to date - nothing to recreate")
+    else:
+        Base.metadata.drop_all(bind=engine)
+        Base.metadata.create_all(bind=engine)
+        print("✅ Database recreated successfully")
     
 except Exception as e:
     print(f"❌ Database error: {e}")
@@ -70,6 +73,3 @@ settings = Settings()
 
 print("🎯 Comprehensive fix completed!")
 print("🚀 Now start the server: uvicorn app.main:app --reload")
-EOF
-
-python comprehensive_fix.py
\ No newline at end of file
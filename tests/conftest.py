@@ -0,0 +1,68 @@
+"""
+Shared Test Configuration
+"""
+
+import os
+import pytest
+
+# Use bcrypt's minimum cost factor so register/login in tests take
+# milliseconds instead of ~100ms each. The real bcrypt code path still
+# runs. Set here because app.config reads it once at import.
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+# Fresh in-memory database per test process. Under pytest-xdist every
+# worker is its own process, so workers never share (or collide on)
+# users and invoices.
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def create_tables():
+    """Create all tables once per test session"""
+    from sqlalchemy import event
+    from app import models  # noqa: F401 - registers models on Base
+    from app.database import engine, init_db
+
+    if engine.dialect.name == "sqlite":
+        # pysqlite's own transaction handling breaks SAVEPOINTs; let
+        # SQLAlchemy emit BEGIN itself so db_transaction can roll back
+        @event.listens_for(engine, "connect")
+        def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+            dbapi_connection.isolation_level = None
+
+        @event.listens_for(engine, "begin")
+        def _emit_begin(connection):
+            connection.exec_driver_sql("BEGIN")
+
+    init_db()
+
+
+@pytest.fixture(autouse=True)
+def db_transaction():
+    """
+    Run each test inside one outer transaction that is rolled back afterwards
+
+    Endpoint sessions join the transaction with SAVEPOINTs, so their
+    commits never reach the database and tests don't see each other's
+    rows. Tables are created only once, by create_tables. Yields the
+    connection for tests that query the database directly.
+    """
+    from sqlalchemy.orm import Session
+    from app.database import engine, get_db
+    from app.main import app
+
+    connection = engine.connect()
+    transaction = connection.begin()
+
+    def override_get_db():
+        db = Session(bind=connection, join_transaction_mode="create_savepoint")
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield connection
+    app.dependency_overrides.pop(get_db, None)
+    transaction.rollback()
+    connection.close()
@@ -0,0 +1,79 @@
+"""
+Auth Service Tests
+"""
+
+import time
+import pytest
+from app.services import auth_service
+from app.services.auth_service import create_access_token, decode_access_token
+
+
+@pytest.fixture
+def jwt_decode_calls(monkeypatch):
+    """Empty token cache and a counter of real jwt.decode calls"""
+    monkeypatch.setattr(auth_service, "_TOKEN_CACHE", {})
+    calls = []
+    real_decode = auth_service.jwt.decode
+
+    def counting_decode(*args, **kwargs):
+        calls.append(args[0])
+        return real_decode(*args, **kwargs)
+
+    monkeypatch.setattr(auth_service.jwt, "decode", counting_decode)
+    return calls
+
+
+def test_decode_cache_hit(jwt_decode_calls):
+    """Repeat decodes of the same token skip jwt.decode"""
+    token = create_access_token({"sub": "cacheuser", "user_id": 1})
+
+    first = decode_access_token(token)
+    second = decode_access_token(token)
+
+    assert first["sub"] == "cacheuser"
+    assert second == first
+    assert len(jwt_decode_calls) == 1
+
+
+def test_decode_cache_ttl_expiry(jwt_decode_calls, monkeypatch):
+    """Entries older than TOKEN_CACHE_TTL are decoded again"""
+    token = create_access_token({"sub": "cacheuser"})
+    decode_access_token(token)
+
+    now = time.time()
+    monkeypatch.setattr(auth_service.time, "time", lambda: now + auth_service.TOKEN_CACHE_TTL + 1)
+    assert decode_access_token(token)["sub"] == "cacheuser"
+
+    assert len(jwt_decode_calls) == 2
+
+
+def test_decode_cache_never_outlives_exp(jwt_decode_calls, monkeypatch):
+    """A token expiring before the TTL is not served from cache past its exp"""
+    token = create_access_token({"sub": "cacheuser"}, expires_delta_seconds=5)
+    payload = decode_access_token(token)
+
+    assert auth_service._TOKEN_CACHE[token][0] == payload["exp"]
+
+    monkeypatch.setattr(auth_service.time, "time", lambda: payload["exp"] + 1)
+    decode_access_token(token)
+
+    assert len(jwt_decode_calls) == 2
+
+
+def test_decode_cache_cleared_at_maxsize(jwt_decode_calls, monkeypatch):
+    """The cache is emptied once it reaches TOKEN_CACHE_MAXSIZE"""
+    monkeypatch.setattr(auth_service, "TOKEN_CACHE_MAXSIZE", 2)
+    tokens = [create_access_token({"sub": f"user{i}"}) for i in range(3)]
+
+    decode_access_token(tokens[0])
+    decode_access_token(tokens[1])
+    assert len(auth_service._TOKEN_CACHE) == 2
+
+    decode_access_token(tokens[2])
+    assert list(auth_service._TOKEN_CACHE) == [tokens[2]]
+
+
+def test_invalid_token_not_cached(jwt_decode_calls):
+    """Invalid tokens return None and are not cached"""
+    assert decode_access_token("invalid.token.here") is None
+    assert auth_service._TOKEN_CACHE == {}
@@ -1,43 +1,16 @@
-cat > test_database.py << 'EOF'
-import sys
-import os
-sys.path.append(os.path.dirname(__file__))
+"""
+Database Tests
+"""
 
-def test_database():
-    """اختبر اتصال قاعدة البيانات وإنشاء الجداول"""
-    print("🔍 Testing database connection...")
-    
-    try:
-        from app.database import engine, Base
-        from app.models.user import User
-        from app.models.invoice import Invoice
-        
-        # تحقق من اتصال قاعدة البيانات
-        with engine.connect() as conn:
-            print("✅ Database connection successful")
-        
-        # تحقق من الجداول
-        from sqlalchemy import inspect
-        inspector = inspect(engine)
-        tables = inspector.get_table_names()
-        print(f"📊 Database tables: {tables}")
-        
-        if 'users' in tables and 'invoices' in tables:
-            print("✅ All required tables exist")
-        else:
-            print("❌ Missing tables. Recreating...")
-            Base.metadata.drop_all(bind=engine)
-            Base.metadata.create_all(bind=engine)
-            print("✅ Tables recreated")
-            
-        return True
-        
-    except Exception as e:
-        print(f"❌ Database test failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+from sqlalchemy import text
+from app.database import schema_matches
 
-if __name__ == "__main__":
-    test_database()
-EOF
\ No newline at end of file
+
+def test_database_connection(db_transaction):
+    """The test database accepts queries"""
+    assert db_transaction.execute(text("SELECT 1")).scalar() == 1
+
+
+def test_schema_matches_models(db_transaction):
+    """Every model table exists with exactly the model's columns"""
+    assert schema_matches(db_transaction)
@@ -1,14 +1,187 @@
 # test_email.py
-import asyncio
+import os
+from unittest.mock import AsyncMock
+
+import aiosmtplib
+import pytest
+from app.config import settings
+from app.services import email_service
 from app.services.email_service import send_email
 
-async def test():
+
+@pytest.mark.asyncio
+async def test_send_email(monkeypatch):
+    """Test building and sending an email (SMTP is mocked)"""
+    send_message = AsyncMock(return_value=None)
+    monkeypatch.setattr(email_service, "_send_message", send_message)
+
     result = await send_email(
-        to_email="your-test-email@example.com",
+        to_email="client@example.com",
         subject="Test Email",
         body="<h1>Test successful!</h1>",
         is_html=True
     )
-    print("✅ Email sent!" if result else "❌ Email failed")
 
-asyncio.run(test())
\ No newline at end of file
+    assert result is True
+    send_message.assert_awaited_once()
+    message = send_message.await_args.args[0]
+    assert message["To"] == "client@example.com"
+    assert message["Subject"] == "Test Email"
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not os.environ.get("RUN_SMTP_TESTS"),
+    reason="set RUN_SMTP_TESTS=<recipient> to send a real email"
+)
+@pytest.mark.asyncio
+async def test_send_email_real_smtp():
+    """Send a real email through the configured SMTP server"""
+    result = await send_email(
+        to_email=os.environ["RUN_SMTP_TESTS"],
+        subject="Test Email",
+        body="<h1>Test successful!</h1>",
+        is_html=True
+    )
+
+    assert result is True
+
+
+@pytest.mark.asyncio
+async def test_send_invoice_emails_isolates_failures(monkeypatch):
+    """A failing job yields False without dropping the other results"""
+    send_message = AsyncMock(side_effect=[None, RuntimeError("SMTP down"), None])
+    monkeypatch.setattr(email_service, "_send_message", send_message)
+
+    job = {
+        "client_name": "Client",
+        "invoice_number": "INV-20260101-0001",
+        "total": 100.0,
+        "currency": "USD",
+        "pdf_path": "",
+    }
+    jobs = [
+        {**job, "to_email": "one@example.com"},
+        {**job, "to_email": "two@example.com"},
+        {**job, "to_email": "three@example.com"},
+        # Missing required arguments - send_invoice_email raises TypeError
+        {"to_email": "broken@example.com"},
+    ]
+
+    results = await email_service.send_invoice_emails(jobs, concurrency=1)
+
+    assert results == [True, False, True, False]
+    assert send_message.await_count == 3
+
+
+class FakeSMTP:
+    """Stand-in for aiosmtplib.SMTP that records connections and sends"""
+
+    instances = []
+
+    def __init__(self, **kwargs):
+        self.is_connected = False
+        self.closed = False
+        self.sent = []
+        self.fail_sends = 0
+        FakeSMTP.instances.append(self)
+
+    async def connect(self):
+        self.is_connected = True
+
+    async def login(self, username, password):
+        pass
+
+    async def send_message(self, message):
+        if self.fail_sends:
+            self.fail_sends -= 1
+            self.is_connected = False
+            raise aiosmtplib.SMTPServerDisconnected("Connection lost")
+        self.sent.append(message)
+
+    async def quit(self):
+        self.is_connected = False
+
+    def close(self):
+        self.is_connected = False
+        self.closed = True
+
+
+@pytest.fixture
+def fake_smtp(monkeypatch):
+    """Route the shared SMTP session through FakeSMTP"""
+    FakeSMTP.instances = []
+    monkeypatch.setattr(aiosmtplib, "SMTP", FakeSMTP)
+    monkeypatch.setattr(email_service, "_smtp", None)
+    return FakeSMTP
+
+
+async def _send(to_email="client@example.com"):
+    return await send_email(to_email=to_email, subject="Test", body="<p>Hi</p>")
+
+
+@pytest.mark.asyncio
+async def test_smtp_session_reused(fake_smtp):
+    """Consecutive sends share one connection"""
+    assert await _send() is True
+    assert await _send() is True
+
+    assert len(fake_smtp.instances) == 1
+    assert len(fake_smtp.instances[0].sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_smtp_reconnects_after_disconnect(fake_smtp):
+    """A dropped session is replaced and the message retried once"""
+    assert await _send() is True
+    fake_smtp.instances[0].fail_sends = 1
+
+    assert await _send("second@example.com") is True
+
+    assert len(fake_smtp.instances) == 2
+    assert fake_smtp.instances[1].sent[0]["To"] == "second@example.com"
+
+
+@pytest.mark.asyncio
+async def test_smtp_closed_when_login_fails(fake_smtp, monkeypatch):
+    """A connected client whose login fails is closed, not leaked"""
+    async def fail_login(self, username, password):
+        raise aiosmtplib.SMTPAuthenticationError(535, "Authentication failed")
+
+    monkeypatch.setattr(FakeSMTP, "login", fail_login)
+    monkeypatch.setattr(settings, "SMTP_USER", "user")
+    monkeypatch.setattr(settings, "SMTP_PASSWORD", "secret")
+
+    assert await _send() is False
+
+    assert fake_smtp.instances[0].closed
+    assert email_service._smtp is None
+
+
+@pytest.mark.asyncio
+async def test_close_smtp(fake_smtp):
+    """close_smtp quits the shared session"""
+    await _send()
+    smtp = fake_smtp.instances[0]
+
+    await email_service.close_smtp()
+
+    assert not smtp.is_connected
+    assert email_service._smtp is None
+
+
+def test_app_shutdown_closes_smtp(monkeypatch):
+    """The lifespan handler closes the shared session on shutdown"""
+    from fastapi.testclient import TestClient
+    from app import main
+
+    close_smtp = AsyncMock()
+    monkeypatch.setattr(main, "close_smtp", close_smtp)
+    # Tables already exist; startup's create_all would nest a BEGIN on
+    # the connection db_transaction holds open
+    monkeypatch.setattr(main, "init_db", lambda: None)
+
+    with TestClient(main.app):
+        close_smtp.assert_not_awaited()
+
+    close_smtp.assert_awaited_once()
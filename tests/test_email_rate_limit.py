@@ -0,0 +1,127 @@
+"""
+Email Rate Limit Tests
+"""
+
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+import pytest
+from fastapi.testclient import TestClient
+from app.api import invoices as invoices_api
+from app.config import settings
+from app.database import get_db
+from app.main import app
+from app.models.invoice import Invoice
+from app.models.user import User
+from app.utils import helpers
+
+client = TestClient(app)
+
+
+def test_sixth_email_in_an_hour_is_rejected(monkeypatch):
+    """EMAIL_RATE_LIMIT sends per hour succeed, the next one gets 429"""
+    monkeypatch.setattr(helpers, "_EMAIL_SENDS", {})
+    send_invoice_email = AsyncMock(return_value=True)
+    monkeypatch.setattr(invoices_api, "send_invoice_email", send_invoice_email)
+
+    client.post("/auth/register", json={
+        "email": "ratelimit@example.com",
+        "username": "ratelimit_user",
+        "password": "testpass123"
+    })
+    token = client.post("/auth/login", json={
+        "username": "ratelimit_user",
+        "password": "testpass123"
+    }).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    user_id = client.get("/users/me", headers=headers).json()["id"]
+
+    # Invoice with a PDF already on record (PDF rendering isn't under test)
+    db = next(app.dependency_overrides[get_db]())
+    invoice = Invoice(
+        invoice_number="INV-20260101-RATE",
+        user_id=user_id,
+        client_name="Client",
+        client_email="client@example.com",
+        items=[{"name": "Service", "quantity": 1, "price": 100, "total": 100}],
+        subtotal=100,
+        total=100,
+        pdf_path="static/invoices/INV-20260101-RATE.pdf",
+    )
+    db.add(invoice)
+    db.commit()
+
+    statuses = [
+        client.post(f"/invoices/{invoice.id}/send-email", headers=headers, json={}).status_code
+        for _ in range(settings.EMAIL_RATE_LIMIT + 1)
+    ]
+
+    assert statuses == [200] * settings.EMAIL_RATE_LIMIT + [429]
+    assert send_invoice_email.await_count == settings.EMAIL_RATE_LIMIT
+
+
+@pytest.fixture
+def tokyo_time(monkeypatch):
+    """Run with a non-UTC local timezone (UTC+9)"""
+    monkeypatch.setenv("TZ", "Asia/Tokyo")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def _user_with_sends(db, username: str, minutes_ago: list) -> int:
+    """Create a user with one emailed invoice per entry in minutes_ago"""
+    user = User(email=f"{username}@example.com", username=username, hashed_password="x")
+    db.add(user)
+    db.flush()
+    for i, minutes in enumerate(minutes_ago):
+        db.add(Invoice(
+            invoice_number=f"INV-20260101-{username}-{i}",
+            user_id=user.id,
+            client_name="Client",
+            client_email="client@example.com",
+            items=[],
+            subtotal=100,
+            total=100,
+            is_sent_email=True,
+            email_sent_at=datetime.utcnow() - timedelta(minutes=minutes),
+        ))
+    db.commit()
+    return user.id
+
+
+def test_seeded_sends_count_on_non_utc_host(monkeypatch, tokyo_time):
+    """Naive UTC email_sent_at values land inside the window whatever the local timezone"""
+    monkeypatch.setattr(helpers, "_EMAIL_SENDS", {})
+    db = next(app.dependency_overrides[get_db]())
+    user_id = _user_with_sends(db, "seed_user", [5, 30, 59])
+
+    result = helpers.validate_email_rate_limit(user_id, db, limit=3)
+
+    assert result["count"] == 3
+    assert result["allowed"] is False
+
+
+def test_empty_window_drops_entry(monkeypatch):
+    """Users with no sends in the window aren't kept in memory"""
+    monkeypatch.setattr(helpers, "_EMAIL_SENDS", {})
+    db = next(app.dependency_overrides[get_db]())
+    user_id = _user_with_sends(db, "idle_user", [])
+
+    result = helpers.validate_email_rate_limit(user_id, db)
+
+    assert result["count"] == 0
+    assert user_id not in helpers._EMAIL_SENDS
+
+
+def test_sends_map_cleared_when_full(monkeypatch):
+    """Seeding a new user into a full map clears it first"""
+    monkeypatch.setattr(helpers, "EMAIL_SENDS_MAXSIZE", 2)
+    monkeypatch.setattr(helpers, "_EMAIL_SENDS", {-1: [time.time()], -2: [time.time()]})
+    db = next(app.dependency_overrides[get_db]())
+    user_id = _user_with_sends(db, "full_user", [5])
+
+    helpers.validate_email_rate_limit(user_id, db)
+
+    assert list(helpers._EMAIL_SENDS) == [user_id]
@@ -0,0 +1,66 @@
+"""
+Schema Field Type Tests
+"""
+
+import pytest
+from pydantic import EmailStr, TypeAdapter, ValidationError
+from app.schemas import fields
+from app.schemas.fields import FastEmail
+
+fast_email = TypeAdapter(FastEmail)
+email_str = TypeAdapter(EmailStr)
+
+
+@pytest.fixture
+def no_fallback(monkeypatch):
+    """Fail if email-validator is consulted, proving the regex path handled it"""
+    def fail(value):
+        raise AssertionError(f"fallback used for {value!r}")
+
+    monkeypatch.setattr(fields, "validate_email", fail)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("user@example.com", "user@example.com"),
+    ("User.Name+tag@Example.COM", "User.Name+tag@example.com"),
+    ("first_last%x@mail.Sub-Domain.co.UK", "first_last%x@mail.sub-domain.co.uk"),
+])
+def test_fast_path_lowercases_domain(value, expected, no_fallback):
+    """ASCII addresses pass the regex; only the domain is lowercased"""
+    assert fast_email.validate_python(value) == expected
+
+
+@pytest.mark.parametrize("value", [
+    "user@example.com",
+    "User.Name+tag@Example.COM",
+])
+def test_fast_path_matches_email_str(value):
+    """Regex-path results are identical to EmailStr"""
+    assert fast_email.validate_python(value) == email_str.validate_python(value)
+
+
+@pytest.mark.parametrize("value", [
+    "a@b",
+    "a..b@x.com",
+    "a.@x.com",
+    "a@x.com.",
+    "a@x..com",
+    "plainaddress",
+    "a@localhost",
+])
+def test_invalid_addresses_rejected(value):
+    """Addresses EmailStr rejects are rejected by FastEmail too"""
+    with pytest.raises(ValidationError):
+        fast_email.validate_python(value)
+    with pytest.raises(ValidationError):
+        email_str.validate_python(value)
+
+
+@pytest.mark.parametrize("value", [
+    "José@example.com",
+    "user@exämple.com",
+    "John Doe <john@Example.com>",
+])
+def test_fallback_matches_email_str(value):
+    """Non-ASCII and "Name <addr>" forms go through email-validator like EmailStr"""
+    assert fast_email.validate_python(value) == email_str.validate_python(value)
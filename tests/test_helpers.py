@@ -0,0 +1,52 @@
+"""
+Helper Utility Tests
+"""
+
+import random
+import pytest
+from app.utils.helpers import calculate_invoice_totals
+
+
+@pytest.mark.parametrize("items, tax_rate, discount_rate, expected", [
+    # 0.25 * 101693.34 = 25423.335 - a half-cent subtotal
+    (
+        [{"quantity": 0.25, "price": 101693.34}],
+        7.25, 0,
+        {"subtotal": 25423.34, "discount_amount": 0.0, "tax_amount": 1843.19, "total": 27266.53},
+    ),
+    (
+        [{"quantity": 0.5, "price": 0.01}, {"quantity": 1.5, "price": 0.01}],
+        0, 0,
+        {"subtotal": 0.02, "discount_amount": 0.0, "tax_amount": 0.0, "total": 0.02},
+    ),
+    (
+        [{"quantity": 3, "price": 0.335}, {"quantity": 0.75, "price": 19.99}],
+        20, 10,
+        {"subtotal": 16.0, "discount_amount": 1.6, "tax_amount": 2.88, "total": 17.28},
+    ),
+])
+def test_totals_round_half_up(items, tax_rate, discount_rate, expected):
+    """Float and Decimal paths both round every field half-up to cents"""
+    assert calculate_invoice_totals(items, tax_rate, discount_rate) == expected
+    assert calculate_invoice_totals(items, tax_rate, discount_rate, use_decimal=True) == expected
+
+
+def test_float_and_decimal_paths_match():
+    """Randomised invoices with sub-cent line sums give identical results"""
+    rng = random.Random(1234)
+    for _ in range(2000):
+        items = [
+            {
+                "quantity": rng.choice([0.25, 0.5, 0.75, 1, 1.5, 2, 3, 12.5]),
+                "price": rng.randint(1, 10_000_000) / 1000,
+            }
+            for _ in range(rng.randint(1, 8))
+        ]
+        tax_rate = rng.choice([0, 5, 7.25, 10, 14, 20])
+        discount_rate = rng.choice([0, 2.5, 5, 10, 15])
+
+        totals = calculate_invoice_totals(items, tax_rate, discount_rate)
+        assert totals == calculate_invoice_totals(items, tax_rate, discount_rate, use_decimal=True), items
+        assert totals["total"] == round(
+            totals["subtotal"] - totals["discount_amount"] + totals["tax_amount"], 2
+        )
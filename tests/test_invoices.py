@@ -2,6 +2,7 @@
 Invoice Tests
 """
 
+import uuid
 import pytest
 from fastapi.testclient import TestClient
 from app.main import app
@@ -9,19 +10,27 @@ from app.main import app
 client = TestClient(app)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def auth_token():
-    """Fixture to get auth token"""
+    """
+    Fixture to get auth token (registered and logged in once per module)
+    
+    The user is created before the per-test rollback transaction starts,
+    so it persists; a unique username keeps it from colliding with other
+    modules or runs.
+    """
+    username = f"invoice_{uuid.uuid4().hex[:12]}"
+    
     # Register user
     client.post("/auth/register", json={
-        "email": "invoice_test@example.com",
-        "username": "invoice_user",
+        "email": f"{username}@example.com",
+        "username": username,
         "password": "testpass123"
     })
     
     # Login
     response = client.post("/auth/login", json={
-        "username": "invoice_user",
+        "username": username,
         "password": "testpass123"
     })
     
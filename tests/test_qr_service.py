@@ -0,0 +1,36 @@
+"""
+QR Service Tests
+"""
+
+import os
+from app.config import settings
+from app.services.qr_service import generate_qr_code
+
+DATA = "https://example.com/pay/testuser-1?invoice=INV-20260101-0001"
+
+
+def test_qr_code_reused_for_same_inputs(tmp_path, monkeypatch):
+    """Same data and settings reuse the existing image"""
+    monkeypatch.setattr(settings, "QR_DIR", str(tmp_path))
+
+    first = generate_qr_code(DATA, "invoice_qr")
+    mtime = os.stat(first).st_mtime_ns
+    second = generate_qr_code(DATA, "invoice_qr")
+
+    assert second == first
+    assert os.stat(second).st_mtime_ns == mtime
+
+
+def test_qr_code_not_reused_across_settings(tmp_path, monkeypatch):
+    """Different data, error correction or box size get their own image"""
+    monkeypatch.setattr(settings, "QR_DIR", str(tmp_path))
+
+    paths = {
+        generate_qr_code(DATA, "invoice_qr"),
+        generate_qr_code(DATA + "&amount=1", "invoice_qr"),
+        generate_qr_code(DATA, "invoice_qr", ec="H"),
+        generate_qr_code(DATA, "invoice_qr", box_size=10),
+    }
+
+    assert len(paths) == 4
+    assert all(os.path.exists(path) for path in paths)
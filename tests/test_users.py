@@ -0,0 +1,46 @@
+"""
+User Profile Tests
+"""
+
+from fastapi.testclient import TestClient
+from app.main import app
+
+client = TestClient(app)
+
+
+def _auth_headers(email: str, username: str) -> dict:
+    client.post("/auth/register", json={
+        "email": email,
+        "username": username,
+        "password": "testpass123"
+    })
+    token = client.post("/auth/login", json={
+        "username": username,
+        "password": "testpass123"
+    }).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_update_own_email_case():
+    """Changing only the capitalisation of your own email is allowed"""
+    headers = _auth_headers("casechange@example.com", "casechange_user")
+
+    response = client.put("/users/me", headers=headers, json={
+        "email": "CaseChange@example.com"
+    })
+
+    assert response.status_code == 200
+    assert response.json()["email"] == "CaseChange@example.com"
+
+
+def test_update_email_taken_by_other_user():
+    """An email registered to another user is rejected, whatever its case"""
+    _auth_headers("taken@example.com", "taken_user")
+    headers = _auth_headers("other@example.com", "other_user")
+
+    response = client.put("/users/me", headers=headers, json={
+        "email": "Taken@example.com"
+    })
+
+    assert response.status_code == 400
+    assert "already registered" in response.json()["detail"].lower()